@@ -8,8 +8,6 @@ import cv2
 import numpy as np
 from PIL import Image
 
-from contentAwareFill import EnhancedContentAwareFill
-
 
 def apply_auto_dark_fill(editor, use_gui=False):
     """
@@ -32,6 +30,9 @@ def apply_auto_dark_fill(editor, use_gui=False):
             if hasattr(editor, "record_state"):
                 editor.record_state(description)
 
+        # Imported here so the dialog modules only load when the dialog is opened
+        from contentAwareFill import EnhancedContentAwareFill
+
         fill_handler = EnhancedContentAwareFill(editor, editor.selection_coords, on_apply_callback=on_apply)
         # Call the auto_apply_dark_fill method directly
         # We need to wait a bit for the dialog to initialize
@@ -4,8 +4,6 @@ Content-aware fill tool implementation
 
 import tkinter as tk
 
-from contentAwareFill import EnhancedContentAwareFill
-
 
 def apply_content_aware_fill(editor, selection_coords=None):
     """
@@ -30,6 +28,9 @@ def apply_content_aware_fill(editor, selection_coords=None):
         if hasattr(editor, "record_state"):
             editor.record_state(description)
 
+    # Imported here so the dialog modules only load when the dialog is opened
+    from contentAwareFill import EnhancedContentAwareFill
+
     # Create the enhanced fill dialog with callback
     fill_handler = EnhancedContentAwareFill(editor, selection_coords, on_apply_callback=on_apply)
     return fill_handler
@@ -229,7 +229,7 @@ class ColorSelectionMixin:
             preview_height = int(preview_width * aspect_ratio)
 
             # Resize for preview
-            preview_img_resized = preview_img.resize((preview_width, preview_height), Image.LANCZOS)
+            preview_img_resized = preview_img.resize((preview_width, preview_height), Image.BILINEAR)
 
             # Create image for canvas
             self.selection_preview_photo = ImageTk.PhotoImage(preview_img_resized)
@@ -317,10 +317,8 @@ class ColorSelectionMixin:
         Returns:
             PIL Image with inpainting applied
         """
-        # Convert PIL image to OpenCV format
-        img_cv = np.array(image)
-        # Convert RGB to BGR (OpenCV uses BGR)
-        img_cv = cv2.cvtColor(img_cv, cv2.COLOR_RGB2BGR)
+        # Get the RGB channels in OpenCV format
+        img_cv = self.get_rgb_copy(self.get_image_array(image), preview)
 
         # Get selection coordinates
         x1, y1, x2, y2 = self.selection_coords
@@ -344,7 +342,7 @@ class ColorSelectionMixin:
         feather = self.feather_edge_var.get()
         if feather > 0:
             # Apply blur to create feathered edges
-            mask = cv2.GaussianBlur(mask, (feather * 2 + 1, feather * 2 + 1), 0)
+            mask = self.blur_mask(mask, feather)
 
         # Get inpainting radius
         inpaint_radius = self.radius_var.get()
@@ -355,9 +353,8 @@ class ColorSelectionMixin:
         else:  # opencv_ns
             result = cv2.inpaint(img_cv, mask, inpaint_radius, cv2.INPAINT_NS)
 
-        # Convert back to RGB and PIL format
-        result_rgb = cv2.cvtColor(result.astype(np.uint8), cv2.COLOR_BGR2RGB)
-        return Image.fromarray(result_rgb)
+        # Convert back to PIL format (the result is already uint8)
+        return Image.fromarray(result)
 
     def on_slider_change(self, value, var):
         """Handle slider changes with debounce and integer-only values"""
@@ -416,8 +413,7 @@ class ColorSelectionMixin:
             self.original_preview_click = ""
 
         # Temporarily show the original image for color selection
-        if hasattr(self, "image_item") and hasattr(self, "before_photo"):
-            self.preview_canvas.itemconfig(self.image_item, image=self.before_photo)
+        self.show_before_image()
 
         # Create new binding for color picking
         def pick_selection_color(event):
@@ -487,8 +483,7 @@ class ColorSelectionMixin:
 
                     # Restore the after image display if appropriate
                     if not getattr(self, "is_hovering", False):
-                        if hasattr(self, "image_item") and hasattr(self, "preview_photo"):
-                            self.preview_canvas.itemconfig(self.image_item, image=self.preview_photo)
+                        self.show_after_image()
 
                     self.status_label.config(text="Color selected for masking")
 
@@ -507,8 +502,7 @@ class ColorSelectionMixin:
 
                 # Restore the after image display
                 if not getattr(self, "is_hovering", False):
-                    if hasattr(self, "image_item") and hasattr(self, "preview_photo"):
-                        self.preview_canvas.itemconfig(self.image_item, image=self.preview_photo)
+                    self.show_after_image()
 
         # Set temporary binding
         self.preview_canvas.bind("<Button-1>", pick_selection_color)
@@ -526,8 +520,8 @@ class ColorSelectionMixin:
         # Process in a separate thread
         def process_preview():
             try:
-                # Create a color mask based on the selected color and tolerance
-                img_np = np.array(self.editor.working_image)
+                # Create a color mask based on the selected color and tolerance (the image is only read)
+                img_np = self.get_image_array(self.editor.working_image)
 
                 # Get the current selection coordinates
                 x1, y1, x2, y2 = self.selection_coords
@@ -538,21 +532,20 @@ class ColorSelectionMixin:
                 x2 = max(0, min(x2, img_np.shape[1]))
                 y2 = max(0, min(y2, img_np.shape[0]))
 
-                # Create a base mask that's zero everywhere except in the current selection
-                base_mask = np.zeros((img_np.shape[0], img_np.shape[1]), dtype=np.uint8)
-                base_mask[y1:y2, x1:x2] = 255
+                # The mask is always restricted to the selection, so only that region is examined
+                region = img_np[y1:y2, x1:x2]
 
                 # Handle different image types
-                if len(img_np.shape) == 2:  # Grayscale
+                if len(region.shape) == 2:  # Grayscale
                     # Convert grayscale to RGB for consistent processing
-                    img_rgb = np.stack([img_np, img_np, img_np], axis=2)
-                elif len(img_np.shape) == 3:
-                    if img_np.shape[2] == 4:  # RGBA
-                        img_rgb = img_np[:, :, :3]  # Take just the RGB channels
-                    elif img_np.shape[2] == 3:  # RGB
-                        img_rgb = img_np
+                    region_rgb = np.stack([region, region, region], axis=2)
+                elif len(region.shape) == 3:
+                    if region.shape[2] == 4:  # RGBA
+                        region_rgb = region[:, :, :3]  # Take just the RGB channels
+                    elif region.shape[2] == 3:  # RGB
+                        region_rgb = region
                     else:
-                        raise ValueError(f"Unexpected image format with {img_np.shape[2]} channels")
+                        raise ValueError(f"Unexpected image format with {region.shape[2]} channels")
                 else:
                     raise ValueError(f"Unexpected image shape: {img_np.shape}")
 
@@ -560,65 +553,35 @@ class ColorSelectionMixin:
                 tolerance = self.tolerance_var.get()
 
                 # Create mask where pixels are within tolerance
-                color_diffs = np.sum(np.abs(img_rgb - np.array(self.selected_color)), axis=2)
-                color_mask = (color_diffs <= tolerance).astype(np.uint8) * 255
+                color_diffs = np.sum(np.abs(region_rgb - np.array(self.selected_color)), axis=2)
+                region_mask = (color_diffs <= tolerance).astype(np.uint8) * 255
 
-                # Intersect the color mask with the base mask to restrict to current selection
-                mask = cv2.bitwise_and(color_mask, base_mask)
-
-                # Apply border expansion if needed
+                # Apply border expansion if needed; the region bounds keep it inside the selection
                 border_size = self.border_size_var.get()
                 if border_size > 0:
                     kernel = np.ones((border_size * 2 + 1, border_size * 2 + 1), np.uint8)
-                    expanded_mask = cv2.dilate(mask, kernel, iterations=1)
-                    # Re-intersect with the base mask to ensure we don't expand outside the selection
-                    mask = cv2.bitwise_and(expanded_mask, base_mask)
+                    region_mask = cv2.dilate(region_mask, kernel, iterations=1)
 
-                # Store the mask for later use
+                # Store the full-size mask for later use
+                mask = np.zeros(img_np.shape[:2], dtype=np.uint8)
+                mask[y1:y2, x1:x2] = region_mask
                 self.color_mask = mask
 
-                # Create a preview overlay
-                overlay = np.zeros_like(img_np)
-
-                # Color the overlay (semi-transparent blue)
-                if len(overlay.shape) == 3:
-                    if overlay.shape[2] == 4:  # RGBA
-                        overlay[mask > 0] = [64, 64, 255, 128]  # Blue with alpha
+                # Overlay color (semi-transparent blue) broadcast over the masked pixels
+                if len(region.shape) == 3:
+                    if region.shape[2] == 4:  # RGBA
+                        overlay_color = np.array([64, 64, 255, 128], dtype=np.float32)  # Blue with alpha
                     else:  # RGB
-                        overlay[mask > 0] = [64, 64, 255]  # Blue
+                        overlay_color = np.array([64, 64, 255], dtype=np.float32)  # Blue
+                    mask_nd = region_mask[:, :, np.newaxis]
                 else:  # Grayscale
-                    overlay[mask > 0] = 200  # Light gray
+                    overlay_color = np.float32(200)  # Light gray
+                    mask_nd = region_mask
 
-                # Combine with original image for preview
+                # Blend the overlay into the selection where the mask is active
                 alpha = 0.5
-                preview = img_np.copy()
-
-                # Create appropriate mask for the blend
-                if len(preview.shape) == 3:
-                    if preview.shape[2] == 4:  # RGBA
-                        mask_nd = np.stack([mask, mask, mask, mask], axis=2)
-                    else:  # RGB
-                        mask_nd = np.stack([mask, mask, mask], axis=2)
-                else:  # Grayscale
-                    mask_nd = mask
-
-                # Use OpenCV's addWeighted for blending where the mask is active
-                if len(preview.shape) == 3:
-                    # For color images
-                    preview_blend = cv2.addWeighted(
-                        preview.astype(np.float32), 1 - alpha, overlay.astype(np.float32), alpha, 0
-                    ).astype(np.uint8)
-                    preview = np.where(mask_nd > 0, preview_blend, preview)
-                else:
-                    # For grayscale images
-                    preview_float = preview.astype(np.float32)
-                    overlay_float = overlay.astype(np.float32)
-                    preview = np.where(
-                        mask > 0, ((1 - alpha) * preview_float + alpha * overlay_float).astype(np.uint8), preview
-                    )
-
-                # Crop preview to just show the current selection area
-                selection_preview = preview[y1:y2, x1:x2]
+                preview_blend = (region.astype(np.float32) * (1 - alpha) + overlay_color * alpha).astype(np.uint8)
+                selection_preview = np.where(mask_nd > 0, preview_blend, region)
 
                 # Convert back to PIL for display
                 preview_img = Image.fromarray(selection_preview)
@@ -1,5 +1,6 @@
 """Main module for Enhanced Content-Aware Fill with multiple algorithm options"""
 
+import collections
 import os
 import threading
 import time
@@ -67,6 +68,7 @@ class EnhancedContentAwareFill(
         self.search_area_var = tk.IntVar(value=15)
         self.feather_edge_var = tk.IntVar(value=2)
         self.eyedropper_active = False
+        self._eyedropper_pixels = None
 
         # Initialize zoom level
         self.zoom_level = 1.0
@@ -76,8 +78,28 @@ class EnhancedContentAwareFill(
         # Preview image reference
         self.preview_image = None
         self.preview_photo = None
+        self.before_photo = None
+        self.after_preview = None
+        self._preview_photo_key = None
+        self._preview_canvas_width = 0
+        self._mask_buf = None
+        self._preview_bufs = {}
+        self._feather_cache = {}
+        self._array_cache = []
+        self._preview_scale = 1.0
+        self._crop_box = None
+        self._crop_box_key = None
+        self._before_cache = None
+        self._last_preview_key = None
+        self._preview_cache = collections.OrderedDict()
+        self._pending_preview_key = None
+        self._last_preview_image = None
         self.is_processing = False
         self.process_thread = None
+        self._fill_cancelled = None
+        self._preview_gen = 0
+        self._preview_after_id = None
+        self._refine_after_id = None
 
         # Main frame with scrolling
         main_frame = ttk.Frame(self.fill_dialog)
@@ -157,6 +179,7 @@ class EnhancedContentAwareFill(
             yscrollcommand=v_scrollbar.set,
         )
         self.preview_canvas.pack(side=tk.LEFT, fill="both", expand=True)
+        self.preview_canvas.bind("<Configure>", self.on_preview_canvas_configure)
 
         # Configure scrollbars to scroll the canvas
         h_scrollbar.config(command=self.preview_canvas.xview)
@@ -197,21 +220,13 @@ class EnhancedContentAwareFill(
 
                 if canvas_x <= x < canvas_x + canvas_width and canvas_y <= y < canvas_y + canvas_height:
                     # Mouse is over canvas
-                    if (
-                        not getattr(self, "is_hovering", False)
-                        and hasattr(self, "image_item")
-                        and hasattr(self, "before_photo")
-                    ):
-                        self.preview_canvas.itemconfig(self.image_item, image=self.before_photo)
+                    if not getattr(self, "is_hovering", False):
+                        self.show_before_image()
                         self.is_hovering = True
                 else:
                     # Mouse is outside canvas
-                    if (
-                        getattr(self, "is_hovering", False)
-                        and hasattr(self, "image_item")
-                        and hasattr(self, "preview_photo")
-                    ):
-                        self.preview_canvas.itemconfig(self.image_item, image=self.preview_photo)
+                    if getattr(self, "is_hovering", False):
+                        self.show_after_image()
                         self.is_hovering = False
 
         # Store panning functions as instance methods
@@ -219,6 +234,10 @@ class EnhancedContentAwareFill(
         self.do_pan = do_pan
         self.end_pan = end_pan
 
+        # Hovering shows the original image
+        self.preview_canvas.bind("<Enter>", self.on_preview_enter)
+        self.preview_canvas.bind("<Leave>", self.on_preview_leave)
+
         # Bind panning events
         self.preview_canvas.bind("<ButtonPress-1>", start_pan)
         self.preview_canvas.bind("<B1-Motion>", do_pan)
@@ -272,8 +291,9 @@ class EnhancedContentAwareFill(
         )
         deep_learning_header.pack(anchor="w", pady=(10, 2))
 
-        has_torch = self.check_module_available("torch")
-        has_tf = self.check_module_available("tensorflow")
+        # Probed once here; the settings panels reuse these flags
+        self._has_torch = has_torch = self.check_module_available("torch")
+        self._has_tf = has_tf = self.check_module_available("tensorflow")
 
         # PyTorch-based option
         pytorch_radio = ttk.Radiobutton(
@@ -330,6 +350,7 @@ class EnhancedContentAwareFill(
 
         self.color_button = tk.Button(color_select_frame, bg=self.color_var.get(), width=3, command=self.pick_color)
         self.color_button.pack(side=tk.LEFT, padx=5)
+        self._last_bg = self.color_var.get()
 
         # Eyedropper button
         eyedropper_btn = ttk.Button(color_select_frame, text="🔍", width=3, command=self.activate_eyedropper)
@@ -342,14 +363,19 @@ class EnhancedContentAwareFill(
         influence_frame = ttk.Frame(self.color_frame)
         influence_frame.grid(row=1, column=1, sticky="we", pady=10)
 
-        influence_scale = ttk.Scale(influence_frame, from_=0, to=1.0, variable=self.influence_var, orient="horizontal")
+        influence_scale = ttk.Scale(
+            influence_frame,
+            from_=0,
+            to=1.0,
+            variable=self.influence_var,
+            orient="horizontal",
+            command=self.on_influence_change,
+        )
         influence_scale.pack(side=tk.LEFT, fill="x", expand=True)
 
         self.influence_label = ttk.Label(influence_frame, text="0%")
         self.influence_label.pack(side=tk.LEFT, padx=5)
-
-        # Setup influence label update
-        self.influence_var.trace_add("write", self.update_influence_label)
+        self._influence_label_pending = False
 
         # Algorithm-specific settings frame
         self.algorithm_settings_frame = ttk.LabelFrame(frame, text="Algorithm Settings", padding=10)
@@ -391,6 +417,21 @@ class EnhancedContentAwareFill(
         self.progress = ttk.Progressbar(frame, orient="horizontal", mode="indeterminate", length=200)
         self.progress.grid(row=row, column=0, sticky="ew", pady=5)
 
+        # Named label styles shared by the settings panels
+        style = ttk.Style(self.fill_dialog)
+        style.configure("Info.TLabel", foreground="blue")
+        style.configure("Hint.TLabel", foreground="gray")
+        style.configure("Err.TLabel", foreground="red")
+
+        # Lookup tables for the per-algorithm preview and settings panel
+        self._build_panel_dispatch()
+
+        # Previews are rendered by a single long-lived worker thread
+        self.start_preview_worker()
+
+        # Eyedropper clicks on the editor canvas are intercepted by a single permanent binding
+        self.install_eyedropper_hook()
+
         # Initialize UI for selected algorithm
         self.update_ui_for_algorithm()
 
@@ -425,12 +466,13 @@ class EnhancedContentAwareFill(
                 print(f"Progress bar stop error (safely ignored): {str(e)}")
 
     # Override the apply_opencv_inpainting method to use our color mask version
-    def apply_opencv_inpainting(self, image, preview=False):
+    def apply_opencv_inpainting(self, image, preview=False, selection=None):
         """Apply OpenCV inpainting algorithm with support for color mask
 
         Args:
             image: PIL Image to process
             preview: Whether this is for preview (lower quality for speed)
+            selection: (x1, y1, x2, y2) region to fill when no color mask is used
 
         Returns:
             PIL Image with inpainting applied
@@ -439,7 +481,7 @@ class EnhancedContentAwareFill(
             return self.apply_opencv_inpainting_with_color_mask(image, preview)
         else:
             # Use the original implementation
-            return super().apply_opencv_inpainting(image, preview)
+            return super().apply_opencv_inpainting(image, preview, selection)
 
     def auto_apply_dark_fill(self):
         """Automatically detect text color and apply content-aware fill"""
@@ -533,21 +575,20 @@ class EnhancedContentAwareFill(
         thread.start()
 
     # Similar override for patch_based method
-    def apply_patch_based(self, image, preview=False):
+    def apply_patch_based(self, image, preview=False, selection=None):
         """Apply patch-based filling algorithm with support for color mask
 
         Args:
             image: PIL Image to process
             preview: Whether this is for preview (lower quality for speed)
+            selection: (x1, y1, x2, y2) region to fill when no color mask is used
 
         Returns:
             PIL Image with patch-based filling applied
         """
         if hasattr(self, "use_color_mask") and self.use_color_mask:
-            # Convert PIL image to OpenCV format
-            img_cv = np.array(image)
-            # Convert RGB to BGR (OpenCV uses BGR)
-            img_cv = cv2.cvtColor(img_cv, cv2.COLOR_RGB2BGR)
+            # Get the RGB channels in OpenCV format
+            img_cv = self.get_rgb_copy(self.get_image_array(image), preview)
 
             # Use color mask instead of rectangular mask
             mask = (
@@ -585,9 +626,8 @@ class EnhancedContentAwareFill(
                     # No pixels in mask, return original
                     return image
 
-            # Convert back to RGB and PIL format
-            result_rgb = cv2.cvtColor(result.astype(np.uint8), cv2.COLOR_BGR2RGB)
-            return Image.fromarray(result_rgb)
+            # Convert back to PIL format (the result is already uint8)
+            return Image.fromarray(result)
         else:
             # Use the original implementation
-            return super().apply_patch_based(image, preview)
+            return super().apply_patch_based(image, preview, selection)
@@ -8,7 +8,8 @@ class FillOperationsMixin:
 
     def apply_fill(self):
         """Apply the selected fill algorithm to the image"""
-        if self.is_processing:
+        # Only one fill at a time
+        if self.process_thread is not None and self.process_thread.is_alive():
             return
 
         # For "none" algorithm, we can just close the dialog without applying changes
@@ -19,30 +20,38 @@ class FillOperationsMixin:
         self.is_processing = True
         self.progress.start(10)
         self.status_label.config(text="Applying fill...")
+        # Cancel stays enabled: it sets the event below and closes the dialog
         self.apply_button.config(state="disabled")
-        self.cancel_button.config(state="disabled")
+
+        # Previews share the feather and array caches with the fill, so the preview worker is stopped
+        # and the fill waits for the preview it may still be rendering. This also discards that preview.
+        self.stop_preview_worker()
+        preview_worker = self._preview_worker
+
+        # Set by cancel_fill; checked between the stages of the fill
+        cancelled = self._fill_cancelled = threading.Event()
 
         # Process in a thread to keep UI responsive
         def process_fill():
             try:
+                preview_worker.join()
+                if cancelled.is_set():
+                    return
+
                 algorithm = self.algorithm_var.get()
 
-                # Apply the selected algorithm
-                if algorithm in ["opencv_telea", "opencv_ns"]:
-                    result = self.apply_opencv_inpainting(self.editor.working_image)
-                elif algorithm == "patch_based":
-                    result = self.apply_patch_based(self.editor.working_image)
-                elif algorithm == "lama_pytorch":
-                    result = self.apply_lama_pytorch(self.editor.working_image)
-                elif algorithm == "deepfill_tf":
-                    result = self.apply_deepfill_tf(self.editor.working_image)
-                else:
-                    result = self.editor.working_image  # Default fallback
+                # Apply the selected algorithm (unknown names fall back to leaving the image unchanged)
+                apply_fill = self._fill_dispatch.get(algorithm, self._fill_dispatch["none"])
+                result = apply_fill(self.editor.working_image)
+                if cancelled.is_set():
+                    return
 
                 # Apply color influence if set
                 influence = self.influence_var.get()
                 if influence > 0:
                     result = self.apply_color_influence(result)
+                if cancelled.is_set():
+                    return
 
                 # Update the working image
                 self.editor.working_image = result
@@ -51,18 +60,29 @@ class FillOperationsMixin:
                 self.fill_dialog.after(0, self.finalize_fill)
             except Exception as e:
                 print(f"Fill error: {e}")
-                self.fill_dialog.after(0, lambda: self.status_label.config(text=f"Error: {str(e)}"))
-                self.fill_dialog.after(0, lambda: self.apply_button.config(state="normal"))
-                self.fill_dialog.after(0, lambda: self.cancel_button.config(state="normal"))
+                if not cancelled.is_set():
+                    self.fill_dialog.after(0, lambda error=e: self._fill_failed(error))
             finally:
                 self.is_processing = False
-                self.fill_dialog.after(0, self.safe_stop_progress)
+                if not cancelled.is_set():
+                    self.fill_dialog.after(0, self.safe_stop_progress)
 
         # Start processing thread
         self.process_thread = threading.Thread(target=process_fill)
         self.process_thread.daemon = True
         self.process_thread.start()
 
+    def _fill_failed(self, error):
+        """Report a failed fill and let the user try again
+
+        Args:
+            error: Exception raised by the fill
+        """
+        self.status_label.config(text=f"Error: {str(error)}")
+        self.apply_button.config(state="normal")
+        # The preview worker was stopped for the fill
+        self.start_preview_worker()
+
     def finalize_fill(self):
         """Finalize the fill operation and close the dialog"""
         # Update display and reset selection
@@ -71,15 +91,16 @@ class FillOperationsMixin:
         self.editor.status_label.config(text=f"Content-aware fill applied using {self.algorithm_var.get()}")
 
         # Close dialog
+        self.stop_preview_worker()
+        self.remove_eyedropper_hook()
         self.fill_dialog.destroy()
 
     def cancel_fill(self):
         """Cancel the fill operation and close the dialog"""
-        # Stop processing if active
+        # Stop processing if active; a running fill discards its result at the next stage boundary
         self.is_processing = False
-        if self.process_thread and self.process_thread.is_alive():
-            # Can't really stop a thread, but we'll set the flag to abort processing
-            pass
+        if self._fill_cancelled is not None:
+            self._fill_cancelled.set()
 
         # Reset eyedropper if active
         if self.eyedropper_active:
@@ -87,4 +108,6 @@ class FillOperationsMixin:
             self.eyedropper_active = False
 
         # Close dialog
+        self.stop_preview_worker()
+        self.remove_eyedropper_hook()
         self.fill_dialog.destroy()
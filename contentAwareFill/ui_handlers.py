@@ -1,173 +1,216 @@
 """UI handler methods for the Enhanced Content-Aware Fill dialog"""
 
+import math
+import queue
 import threading
 import tkinter as tk
 from tkinter import colorchooser, ttk
 
-import cv2
-import numpy as np
 from PIL import Image, ImageTk
 
+# Pixels shown around the selection in the preview
+PREVIEW_MARGIN = 50
 
-class UIHandlersMixin:
-    """Mixin class for UI handling methods"""
-
-    def update_ui_for_algorithm(self):
-        """Update UI elements based on selected algorithm"""
-        # Clear the algorithm settings frame
-        for widget in self.algorithm_settings_frame.winfo_children():
-            widget.destroy()
-
-        algorithm = self.algorithm_var.get()
-
-        if algorithm == "none":
-            # No settings needed for "None" option
-            ttk.Label(
-                self.algorithm_settings_frame,
-                text="No algorithm selected - original image will be displayed",
-                foreground="blue",
-            ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
-
-        elif algorithm in ["opencv_telea", "opencv_ns"]:
-            # OpenCV settings
-            ttk.Label(self.algorithm_settings_frame, text="Inpainting Radius:").grid(
-                row=0, column=0, sticky="w", pady=5
-            )
-
-            radius_frame = ttk.Frame(self.algorithm_settings_frame)
-            radius_frame.grid(row=0, column=1, sticky="w", pady=5)
-
-            radius_scale = ttk.Scale(radius_frame, from_=1, to=20, variable=self.radius_var, orient="horizontal")
-            radius_scale.pack(side=tk.LEFT, fill="x", expand=True)
-
-            radius_label = ttk.Label(radius_frame, textvariable=self.radius_var)
-            radius_label.pack(side=tk.LEFT, padx=5)
-
-            # Edge feathering
-            ttk.Label(self.algorithm_settings_frame, text="Edge Feathering:").grid(row=1, column=0, sticky="w", pady=5)
-
-            feather_frame = ttk.Frame(self.algorithm_settings_frame)
-            feather_frame.grid(row=1, column=1, sticky="w", pady=5)
-
-            feather_scale = ttk.Scale(
-                feather_frame, from_=0, to=10, variable=self.feather_edge_var, orient="horizontal"
-            )
-            feather_scale.pack(side=tk.LEFT, fill="x", expand=True)
+# Quiet period after the last slider change before a preview is rendered
+PREVIEW_DEBOUNCE_MS = 150
+PREVIEW_MAX_WIDTH = 512
 
-            feather_label = ttk.Label(feather_frame, textvariable=self.feather_edge_var)
-            feather_label.pack(side=tk.LEFT, padx=5)
+# Number of rendered previews kept so returning to recent settings is instant
+PREVIEW_CACHE_SIZE = 8
 
-            ttk.Label(
-                self.algorithm_settings_frame,
-                text="Feathering creates a gradual transition at the selection edges",
-                foreground="gray",
-            ).grid(row=2, column=0, columnspan=2, sticky="w")
-
-        elif algorithm == "patch_based":
-            # Patch-based settings
-            ttk.Label(self.algorithm_settings_frame, text="Patch Size:").grid(row=0, column=0, sticky="w", pady=5)
-
-            patch_frame = ttk.Frame(self.algorithm_settings_frame)
-            patch_frame.grid(row=0, column=1, sticky="w", pady=5)
+# Previews are small on-screen images, so a cheap filter is indistinguishable from LANCZOS
+PREVIEW_RESAMPLE = Image.BILINEAR
 
-            patch_scale = ttk.Scale(patch_frame, from_=3, to=15, variable=self.patch_size_var, orient="horizontal")
-            patch_scale.pack(side=tk.LEFT, fill="x", expand=True)
+# Once the settings have been left alone this long, the shown preview is re-rendered with LANCZOS
+PREVIEW_REFINE_MS = 500
 
-            patch_label = ttk.Label(patch_frame, textvariable=self.patch_size_var)
-            patch_label.pack(side=tk.LEFT, padx=5)
 
-            # Search area
-            ttk.Label(self.algorithm_settings_frame, text="Search Area:").grid(row=1, column=0, sticky="w", pady=5)
-
-            search_frame = ttk.Frame(self.algorithm_settings_frame)
-            search_frame.grid(row=1, column=1, sticky="w", pady=5)
+class UIHandlersMixin:
+    """Mixin class for UI handling methods"""
 
-            search_scale = ttk.Scale(search_frame, from_=5, to=50, variable=self.search_area_var, orient="horizontal")
-            search_scale.pack(side=tk.LEFT, fill="x", expand=True)
+    def update_ui_for_algorithm(self):
+        """Update UI elements based on selected algorithm"""
+        # Hide the current settings panel; each panel is built once and then reused
+        for panel in self._settings_panels.values():
+            panel.grid_remove()
+
+        panel_key = self._panel_keys.get(self.algorithm_var.get())
+        if panel_key is not None:
+            panel = self._settings_panels.get(panel_key)
+            if panel is None:
+                panel = ttk.Frame(self.algorithm_settings_frame)
+                self._panel_builders[panel_key](panel)
+                self._settings_panels[panel_key] = panel
+            panel.grid(row=0, column=0, sticky="nsew")
 
-            search_label = ttk.Label(search_frame, textvariable=self.search_area_var)
-            search_label.pack(side=tk.LEFT, padx=5)
+        # Update the preview if enabled
+        if self.preview_var.get():
+            self.update_preview()
 
+    def _build_panel_dispatch(self):
+        """Build the algorithm lookup tables used by the fill, the preview and the settings panel"""
+        # Every entry takes (image, preview=False, selection=None); "none" leaves the image untouched
+        self._fill_dispatch = {
+            "none": lambda img, preview=False, selection=None: img,
+            "opencv_telea": self.apply_opencv_inpainting,
+            "opencv_ns": self.apply_opencv_inpainting,
+            "patch_based": self.apply_patch_based,
+            "lama_pytorch": self.apply_lama_pytorch,
+            "deepfill_tf": self.apply_deepfill_tf,
+        }
+        # Both OpenCV variants share one settings panel
+        self._panel_keys = {
+            "none": "none",
+            "opencv_telea": "opencv",
+            "opencv_ns": "opencv",
+            "patch_based": "patch_based",
+            "lama_pytorch": "lama_pytorch",
+            "deepfill_tf": "deepfill_tf",
+        }
+        self._panel_builders = {
+            "none": self._build_none_settings,
+            "opencv": self._build_opencv_settings,
+            "patch_based": self._build_patch_settings,
+            "lama_pytorch": self._build_lama_settings,
+            "deepfill_tf": self._build_deepfill_settings,
+        }
+        self._settings_panels = {}
+
+    def _add_scale_row(self, parent, row, text, variable, from_, to):
+        """Add a labelled scale with a value readout to a settings panel"""
+        ttk.Label(parent, text=text).grid(row=row, column=0, sticky="w", pady=5)
+
+        scale_frame = ttk.Frame(parent)
+        scale_frame.grid(row=row, column=1, sticky="w", pady=5)
+
+        scale = ttk.Scale(
+            scale_frame, from_=from_, to=to, variable=variable, orient="horizontal", command=self._schedule_preview
+        )
+        scale.pack(side=tk.LEFT, fill="x", expand=True)
+
+        value_label = ttk.Label(scale_frame, textvariable=variable)
+        value_label.pack(side=tk.LEFT, padx=5)
+
+    def _build_none_settings(self, parent):
+        """No settings needed for "None" option"""
+        ttk.Label(
+            parent,
+            text="No algorithm selected - original image will be displayed",
+            style="Info.TLabel",
+        ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
+
+    def _build_opencv_settings(self, parent):
+        """OpenCV settings"""
+        self._add_scale_row(parent, 0, "Inpainting Radius:", self.radius_var, 1, 20)
+        self._add_scale_row(parent, 1, "Edge Feathering:", self.feather_edge_var, 0, 10)
+
+        ttk.Label(
+            parent,
+            text="Feathering creates a gradual transition at the selection edges",
+            style="Hint.TLabel",
+        ).grid(row=2, column=0, columnspan=2, sticky="w")
+
+    def _build_patch_settings(self, parent):
+        """Patch-based settings"""
+        self._add_scale_row(parent, 0, "Patch Size:", self.patch_size_var, 3, 15)
+        self._add_scale_row(parent, 1, "Search Area:", self.search_area_var, 5, 50)
+
+        ttk.Label(
+            parent,
+            text="Larger search area may give better results but is slower",
+            style="Hint.TLabel",
+        ).grid(row=2, column=0, columnspan=2, sticky="w")
+
+    def _build_deep_learning_settings(self, parent, available, install_text, download_text):
+        """Settings shared by the deep learning algorithms"""
+        if not available:
             ttk.Label(
-                self.algorithm_settings_frame,
-                text="Larger search area may give better results but is slower",
-                foreground="gray",
-            ).grid(row=2, column=0, columnspan=2, sticky="w")
-
-        elif algorithm == "lama_pytorch":
-            # LaMa (PyTorch) settings
-            if not self.check_module_available("torch"):
-                ttk.Label(
-                    self.algorithm_settings_frame,
-                    text="PyTorch not installed. Install with:\npip install torch torchvision",
-                    foreground="red",
-                ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
-            else:
-                ttk.Label(
-                    self.algorithm_settings_frame, text="First use will download the model (~100 MB)", foreground="blue"
-                ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
-
-                # Edge feathering
-                ttk.Label(self.algorithm_settings_frame, text="Edge Feathering:").grid(
-                    row=1, column=0, sticky="w", pady=5
-                )
-
-                feather_frame = ttk.Frame(self.algorithm_settings_frame)
-                feather_frame.grid(row=1, column=1, sticky="w", pady=5)
-
-                feather_scale = ttk.Scale(
-                    feather_frame, from_=0, to=10, variable=self.feather_edge_var, orient="horizontal"
-                )
-                feather_scale.pack(side=tk.LEFT, fill="x", expand=True)
-
-                feather_label = ttk.Label(feather_frame, textvariable=self.feather_edge_var)
-                feather_label.pack(side=tk.LEFT, padx=5)
-
-        elif algorithm == "deepfill_tf":
-            # DeepFill (TensorFlow) settings
-            if not self.check_module_available("tensorflow"):
-                ttk.Label(
-                    self.algorithm_settings_frame,
-                    text="TensorFlow not installed. Install with:\npip install tensorflow",
-                    foreground="red",
-                ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
-            else:
-                ttk.Label(
-                    self.algorithm_settings_frame, text="First use will download the model (~30 MB)", foreground="blue"
-                ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
+                parent,
+                text=install_text,
+                style="Err.TLabel",
+            ).grid(row=0, column=0, columnspan=2, sticky="w", pady=5)
+            return
 
-                # Edge feathering
-                ttk.Label(self.algorithm_settings_frame, text="Edge Feathering:").grid(
-                    row=1, column=0, sticky="w", pady=5
-                )
+        ttk.Label(parent, text=download_text, style="Info.TLabel").grid(
+            row=0, column=0, columnspan=2, sticky="w", pady=5
+        )
+        self._add_scale_row(parent, 1, "Edge Feathering:", self.feather_edge_var, 0, 10)
+
+    def _build_lama_settings(self, parent):
+        """LaMa (PyTorch) settings"""
+        self._build_deep_learning_settings(
+            parent,
+            self._has_torch,
+            "PyTorch not installed. Install with:\npip install torch torchvision",
+            "First use will download the model (~100 MB)",
+        )
+
+    def _build_deepfill_settings(self, parent):
+        """DeepFill (TensorFlow) settings"""
+        self._build_deep_learning_settings(
+            parent,
+            self._has_tf,
+            "TensorFlow not installed. Install with:\npip install tensorflow",
+            "First use will download the model (~30 MB)",
+        )
+
+    def on_influence_change(self, *args):
+        """Handle a color influence slider move with a single callback for the label and the preview"""
+        self.update_influence_label()
+        self._schedule_preview()
 
-                feather_frame = ttk.Frame(self.algorithm_settings_frame)
-                feather_frame.grid(row=1, column=1, sticky="w", pady=5)
+    def update_influence_label(self, *args):
+        """Schedule an influence label refresh, coalescing the writes of a slider drag"""
+        if self._influence_label_pending:
+            return
+        self._influence_label_pending = True
+        self.fill_dialog.after_idle(self._apply_influence_label)
 
-                feather_scale = ttk.Scale(
-                    feather_frame, from_=0, to=10, variable=self.feather_edge_var, orient="horizontal"
-                )
-                feather_scale.pack(side=tk.LEFT, fill="x", expand=True)
+    def _apply_influence_label(self):
+        """Show the current color influence as a percentage"""
+        self._influence_label_pending = False
+        self.influence_label.config(text=f"{int(self.influence_var.get() * 100)}%")
 
-                feather_label = ttk.Label(feather_frame, textvariable=self.feather_edge_var)
-                feather_label.pack(side=tk.LEFT, padx=5)
+    def set_fill_color(self, hex_color):
+        """Set the fill color and its swatch, skipping the Tk round-trip if nothing changed
 
-        # Update the preview if enabled
-        if self.preview_var.get():
-            self.update_preview()
+        Args:
+            hex_color: Color as a "#rrggbb" string
 
-    def update_influence_label(self, *args):
-        """Update the influence percentage label"""
-        self.influence_label.config(text=f"{int(self.influence_var.get() * 100)}%")
+        Returns:
+            bool: True if the color changed
+        """
+        if hex_color == self._last_bg:
+            return False
+        self.color_var.set(hex_color)
+        self.color_button.config(bg=hex_color)
+        self._last_bg = hex_color
+        return True
 
     def pick_color(self):
         """Open color picker dialog"""
         color = colorchooser.askcolor(self.color_var.get())[1]
-        if color:
-            self.color_var.set(color)
-            self.color_button.config(bg=color)
-            if self.preview_var.get():
-                self.update_preview()
+        if color and self.set_fill_color(color) and self.preview_var.get():
+            self.update_preview()
+
+    def install_eyedropper_hook(self):
+        """Route clicks on the editor canvas through the eyedropper before the editor's own handler
+
+        The handler lives on a dedicated bind tag placed in front of the canvas's own tags, so it is
+        installed once per dialog and returns "break" only while the eyedropper is active.
+        """
+        canvas = self.editor.canvas
+        self._eyedropper_tag = f"eyedropper{id(self)}"
+        canvas.bind_class(self._eyedropper_tag, "<Button-1>", self.pick_color_from_image)
+        canvas.bindtags((self._eyedropper_tag,) + canvas.bindtags())
+
+    def remove_eyedropper_hook(self):
+        """Remove the eyedropper bind tag from the editor canvas"""
+        canvas = self.editor.canvas
+        if not canvas.winfo_exists():
+            return
+        canvas.bindtags(tuple(tag for tag in canvas.bindtags() if tag != self._eyedropper_tag))
+        canvas.unbind_class(self._eyedropper_tag, "<Button-1>")
 
     def activate_eyedropper(self):
         """Activate the eyedropper tool to pick a color from the image"""
@@ -180,155 +223,437 @@ class UIHandlersMixin:
         if hasattr(self, "toggle_eyedropper_mode"):
             self.toggle_eyedropper_mode(True)
 
-        # Store original bindings
-        self.original_click = self.editor.canvas.bind("<Button-1>")
-
-        # Create new binding for color picking
-        def pick_color_from_image(event):
-            if not self.eyedropper_active:
-                return
-
-            # Calculate image coordinates from canvas coordinates
-            canvas_x = self.editor.canvas.canvasx(event.x)
-            canvas_y = self.editor.canvas.canvasy(event.y)
-            image_x = int(canvas_x / self.editor.zoom_factor)
-            image_y = int(canvas_y / self.editor.zoom_factor)
-
-            # Check if within image bounds
-            if 0 <= image_x < self.editor.img_width and 0 <= image_y < self.editor.img_height:
-                # Get color at this position
-                try:
-                    rgb = self.editor.working_image.getpixel((image_x, image_y))[:3]
-                    hex_color = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-                    self.color_var.set(hex_color)
-                    self.color_button.config(bg=hex_color)
-
-                    # Reset cursor and bindings
-                    self.editor.canvas.config(cursor="")
-                    self.eyedropper_active = False
-                    self.fill_dialog.grab_set()  # Restore dialog as modal
-                    self.editor.status_label.config(text="Color sampled")
+        # Reuse the NumPy view the fills already made of the working image, so a click is a plain index
+        self._eyedropper_pixels = self.get_image_array(self.editor.working_image)
 
-                    # If we have toggle_eyedropper_mode function, call it
-                    if hasattr(self, "toggle_eyedropper_mode"):
-                        self.toggle_eyedropper_mode(False)
+    def pick_color_from_image(self, event):
+        """Sample the fill color from the editor canvas while the eyedropper is active
 
-                    # Restore original binding
-                    self.editor.canvas.bind("<Button-1>", self.original_click)
-
-                    # Update preview
-                    if self.preview_var.get():
-                        self.update_preview()
-                except Exception as e:
-                    print(f"Error sampling color: {e}")
+        Args:
+            event: Click event on the editor canvas
 
-        # Set temporary binding
-        self.editor.canvas.bind("<Button-1>", pick_color_from_image)
+        Returns:
+            "break" to keep the editor from handling the click, None otherwise
+        """
+        if not self.eyedropper_active:
+            return None
+
+        # Calculate image coordinates from canvas coordinates
+        canvas_x = self.editor.canvas.canvasx(event.x)
+        canvas_y = self.editor.canvas.canvasy(event.y)
+        image_x = int(canvas_x / self.editor.zoom_factor)
+        image_y = int(canvas_y / self.editor.zoom_factor)
+
+        # Check if within image bounds
+        if 0 <= image_x < self.editor.img_width and 0 <= image_y < self.editor.img_height:
+            # Get color at this position
+            try:
+                rgb = tuple(self._eyedropper_pixels[image_y, image_x, :3].tolist())
+                color_changed = self.set_fill_color("#%02x%02x%02x" % rgb)
+
+                # Reset cursor and state
+                self.editor.canvas.config(cursor="")
+                self.eyedropper_active = False
+                self._eyedropper_pixels = None
+                self.fill_dialog.grab_set()  # Restore dialog as modal
+                self.editor.status_label.config(text="Color sampled")
+
+                # If we have toggle_eyedropper_mode function, call it
+                if hasattr(self, "toggle_eyedropper_mode"):
+                    self.toggle_eyedropper_mode(False)
+
+                # Update preview
+                if color_changed and self.preview_var.get():
+                    self.update_preview()
+            except Exception as e:
+                print(f"Error sampling color: {e}")
+
+        return "break"
 
     def toggle_preview(self):
         """Toggle the preview on/off"""
         if self.preview_var.get():
             self.update_preview()
         else:
+            # Drop any preview that is still rendering
+            self._cancel_preview_refine()
+            self._preview_gen += 1
+            if self.is_processing:
+                self.is_processing = False
+                self.safe_stop_progress()
+
             # Clear preview
             self.preview_canvas.delete("all")
             self.preview_status.config(text="Preview disabled")
 
+    def _schedule_preview(self, *args):
+        """Request a preview once the settings have stopped changing for a moment
+
+        Slider drags fire many events per second; only the last one in the debounce window renders.
+        """
+        if not self.preview_var.get():
+            return
+        if self._preview_after_id is not None:
+            self.fill_dialog.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.fill_dialog.after(PREVIEW_DEBOUNCE_MS, self._run_scheduled_preview)
+
+    def _run_scheduled_preview(self):
+        """Render the preview requested by _schedule_preview"""
+        self._preview_after_id = None
+        self.update_preview()
+
+    def start_preview_worker(self):
+        """Start the long-lived thread that renders previews in the background"""
+        # Single-slot queue: a newer preview request replaces a pending one
+        self._preview_queue = queue.Queue(maxsize=1)
+        self._preview_worker = threading.Thread(target=self._preview_loop)
+        self._preview_worker.daemon = True
+        self._preview_worker.start()
+
+    def stop_preview_worker(self):
+        """Ask the preview worker to exit and discard the job it is currently running"""
+        self._cancel_preview_refine()
+        self._preview_gen += 1
+        self._queue_preview_job(None)
+
+    def _queue_preview_job(self, job):
+        """Replace any pending preview job with a new one"""
+        try:
+            self._preview_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._preview_queue.put(job)
+
+    def _preview_loop(self):
+        """Process preview jobs until the stop sentinel is received"""
+        while True:
+            job = self._preview_queue.get()
+            if job is None:
+                break
+            self.process_preview(*job)
+
+    def _preview_inputs_key(self):
+        """Collect everything a preview depends on except the working image itself
+
+        Returns:
+            tuple that compares equal when a preview would render the same result
+        """
+        return (
+            self.algorithm_var.get(),
+            self.radius_var.get(),
+            self.feather_edge_var.get(),
+            self.patch_size_var.get(),
+            self.search_area_var.get(),
+            self.influence_var.get(),
+            self.color_var.get(),
+            tuple(self.selection_coords),
+            self.use_color_mask,
+            id(self.color_mask) if self.use_color_mask else None,
+            self._preview_canvas_width,
+        )
+
     def update_preview(self):
         """Update the preview with the current settings"""
-        if self.is_processing:
+        # The preview worker is stopped while a fill runs
+        if self.process_thread is not None and self.process_thread.is_alive():
+            return
+        self._cancel_preview_refine()
+        key = self._preview_inputs_key()
+
+        # Rendered previews are only valid for the working image they were made from
+        if self.editor.working_image is not self._last_preview_image:
+            self._preview_cache.clear()
+            self._last_preview_key = None
+            self._last_preview_image = self.editor.working_image
+        elif self.is_processing and key == self._pending_preview_key:
+            # This exact preview is already being rendered
             return
 
+        # Nothing that affects the preview has changed since it was last shown
+        if key == self._last_preview_key and not self.is_processing:
+            if not self.preview_canvas.find_withtag("after"):
+                self.update_preview_canvas()
+            self.preview_status.config(text="Preview unchanged - hover to see original")
+            return
+
+        # Settings that were rendered recently are shown straight from the cache
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            # Drop whatever is still rendering for the previous settings
+            self._preview_gen += 1
+            if self.is_processing:
+                self.is_processing = False
+                self.safe_stop_progress()
+            self._last_preview_key = key
+            self._show_preview(*cached)
+            return
+
+        self._pending_preview_key = key
+
+        # Mark the dialog busy right away, before the worker picks the job up
         self.is_processing = True
         self.progress.start(10)
         self.status_label.config(text="Processing...")
         self.preview_status.config(text="Generating preview...")
 
-        # Create a thread for processing to avoid freezing UI
-        self.process_thread = threading.Thread(target=self.process_preview)
-        self.process_thread.daemon = True
-        self.process_thread.start()
+        # Every request starts a new generation so older results can be discarded
+        self._preview_gen += 1
 
-    def process_preview(self):
-        try:
-            # Get a copy of the working image
-            img_copy = self.editor.working_image.copy()
-            algorithm = self.algorithm_var.get()
+        # Hand the request to the preview worker to avoid freezing UI
+        self._queue_preview_job((self.algorithm_var.get(), self._preview_gen))
 
-            # Get selection coordinates
-            x1, y1, x2, y2 = self.selection_coords
+    def _cancel_preview_refine(self):
+        """Cancel a pending high-quality re-render of the current preview"""
+        if self._refine_after_id is not None:
+            self.fill_dialog.after_cancel(self._refine_after_id)
+            self._refine_after_id = None
 
-            # Create a before/after comparison image
-            # Make a copy of the original for the "before" part
-            before_img = img_copy.copy()
-
-            # Apply the selected algorithm to get "after" preview
-            if algorithm == "none":
-                # For "None" option, use the original image as the "after" image as well
-                after_img = before_img.copy()
-            elif algorithm in ["opencv_telea", "opencv_ns"]:
-                after_img = self.apply_opencv_inpainting(img_copy, preview=True)
-            elif algorithm == "patch_based":
-                after_img = self.apply_patch_based(img_copy, preview=True)
-            elif algorithm == "lama_pytorch":
-                after_img = self.apply_lama_pytorch(img_copy, preview=True)
-            elif algorithm == "deepfill_tf":
-                after_img = self.apply_deepfill_tf(img_copy, preview=True)
-            else:
-                after_img = img_copy.copy()  # Default fallback
+    def _refine_preview(self):
+        """Re-render the settled preview with LANCZOS resampling
 
-            # Get color influence if set - only apply if we're not using "none" algorithm
-            influence = self.influence_var.get()
-            if influence > 0 and algorithm != "none":
-                after_img = self.apply_color_influence(after_img, preview=True)
+        Runs without the busy indicator; any settings change supersedes it like a normal preview.
+        """
+        self._refine_after_id = None
+        if not self.preview_var.get() or self.is_processing:
+            return
+        if self.editor.working_image is not self._last_preview_image:
+            return
+        if self._last_preview_key != self._preview_inputs_key():
+            return
+
+        self._pending_preview_key = self._last_preview_key
+        self._preview_gen += 1
+        self._queue_preview_job((self.algorithm_var.get(), self._preview_gen, Image.LANCZOS))
+
+    def process_preview(self, algorithm, gen, resample=PREVIEW_RESAMPLE):
+        """Render the before/after preview for the given algorithm
+
+        Args:
+            algorithm: Algorithm name captured when the preview was requested
+            gen: Preview generation; the result is dropped if a newer preview was requested
+            resample: PIL resampling filter used to scale the preview regions
+        """
+        if gen != self._preview_gen:
+            return
+
+        try:
+            # The apply_* methods only read their input, so the working image is used without copying it
+            source = self.editor.working_image
 
             # Create side-by-side preview
             # For preview, crop to the selection area plus some margin
-            margin = 50  # pixels around the selection
-            crop_x1 = max(0, x1 - margin)
-            crop_y1 = max(0, y1 - margin)
-            crop_x2 = min(img_copy.width, x2 + margin)
-            crop_y2 = min(img_copy.height, y2 + margin)
-
-            # Crop both images to the same region
-            before_crop = before_img.crop((crop_x1, crop_y1, crop_x2, crop_y2))
-            after_crop = after_img.crop((crop_x1, crop_y1, crop_x2, crop_y2))
+            crop_box = self.get_preview_crop_box(source.size)
+            crop_width, crop_height = crop_box[2] - crop_box[0], crop_box[3] - crop_box[1]
 
             # Create preview image (scaled down if needed)
-            preview_width = self.preview_canvas.winfo_width() - 10
+            preview_width = min(self._preview_canvas_width - 10, PREVIEW_MAX_WIDTH)
             if preview_width < 100:  # If canvas not yet sized, use a default
                 preview_width = 300
 
             # Calculate aspect ratio and preview size
-            aspect_ratio = before_crop.height / before_crop.width
-            preview_height = int(preview_width * aspect_ratio)
-
-            # Resize for preview
-            before_preview = before_crop.resize((preview_width, preview_height), Image.LANCZOS)
-            after_preview = after_crop.resize((preview_width, preview_height), Image.LANCZOS)
-
-            # Store both images for the split preview
-            self.before_preview = before_preview
-            self.after_preview = after_preview
-
-            # For "none" algorithm, both before and after are the same
-            if algorithm == "none":
-                # Use same image for both
-                self.preview_photo = ImageTk.PhotoImage(before_preview)
-                self.before_photo = ImageTk.PhotoImage(before_preview)
+            aspect_ratio = crop_height / crop_width
+            preview_size = (preview_width, int(preview_width * aspect_ratio))
+
+            # Apply the selected algorithm to get "after" preview ("none" and unknown names keep the original)
+            apply_fill = self._fill_dispatch.get(algorithm, self._fill_dispatch["none"])
+            influence = self.influence_var.get()
+
+            # The "before" part only changes with the image, the selection or the preview size
+            before_preview = self.get_before_preview(source, crop_box, preview_size, resample)
+
+            # When the region is shown downscaled, fill the downscaled "before" image directly instead of
+            # the full-resolution one. The color mask only exists at full resolution, so it keeps the slow path.
+            if preview_size[0] < crop_width and algorithm != "none" and not self.use_color_mask:
+                selection = self.get_preview_selection(crop_box, preview_size)
+                # Feather, radius, patch size and search area are scaled down with the region
+                self._preview_scale = preview_size[0] / crop_width
+                try:
+                    after_preview = apply_fill(before_preview, preview=True, selection=selection)
+
+                    if gen != self._preview_gen:
+                        return
+
+                    if influence > 0:
+                        after_preview = self.apply_color_influence(after_preview, preview=True, selection=selection)
+                    else:
+                        # The result may share a reused preview buffer, but it is cached and shown later
+                        after_preview = after_preview.copy()
+                finally:
+                    self._preview_scale = 1.0
             else:
-                # Create initial display with "after" result for other algorithms
-                self.preview_photo = ImageTk.PhotoImage(after_preview)
-                self.before_photo = ImageTk.PhotoImage(before_preview)
+                after_img = apply_fill(source, preview=True)
+
+                # Skip the remaining work if the settings changed while inpainting
+                if gen != self._preview_gen:
+                    return
+
+                # Get color influence if set - only apply if we're not using "none" algorithm
+                if influence > 0 and algorithm != "none":
+                    after_img = self.apply_color_influence(after_img, preview=True)
+
+                if gen != self._preview_gen:
+                    return
 
-            # Update UI in main thread
-            self.fill_dialog.after(0, self.update_preview_canvas)
+                after_preview = self.resize_preview_region(after_img, crop_box, preview_size, resample)
+
+            if gen != self._preview_gen:
+                return
+
+            # Apply all UI changes in one main-thread callback
+            previews = (before_preview, after_preview)
+            self.fill_dialog.after_idle(lambda: self._finish_preview(gen, previews, refined=resample == Image.LANCZOS))
         except Exception as e:
             print(f"Preview error: {e}")
-            self.fill_dialog.after(0, lambda: self.preview_status.config(text=f"Preview error: {str(e)}"))
-        finally:
-            self.is_processing = False
-            self.fill_dialog.after(0, self.safe_stop_progress)
+            # Bind the exception now; "e" is cleared when the except block ends
+            self.fill_dialog.after_idle(lambda error=e: self._finish_preview(gen, error=error))
+
+    def _finish_preview(self, gen, previews=None, error=None, refined=False):
+        """Apply a finished preview to the UI if it still belongs to the latest request
+
+        A stale preview leaves the busy state and progress bar to the newer one.
+
+        Args:
+            gen: Preview generation the result was rendered for
+            previews: (before_preview, after_preview) PIL Images, or None if rendering failed
+            error: Exception raised while rendering, if any
+            refined: Whether the previews were rendered at the final LANCZOS quality
+        """
+        if gen != self._preview_gen:
+            return
+
+        self.is_processing = False
+        self.safe_stop_progress()
+
+        if error is not None:
+            self._last_preview_key = None
+            self.preview_status.config(text=f"Preview error: {str(error)}")
+        else:
+            key = self._last_preview_key = self._pending_preview_key
+            self._preview_cache[key] = previews
+            if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                self._preview_cache.popitem(last=False)
+            self._show_preview(*previews)
+
+            # Interactive previews use a cheap filter; redo them properly once the user stops adjusting
+            if not refined:
+                self._refine_after_id = self.fill_dialog.after(PREVIEW_REFINE_MS, self._refine_preview)
+
+    def get_before_preview(self, image, crop_box, preview_size, resample=PREVIEW_RESAMPLE):
+        """Get the resized original region, reusing it while only the algorithm settings change
+
+        Args:
+            image: The unmodified working image
+            crop_box: (x1, y1, x2, y2) region to show
+            preview_size: (width, height) of the preview
+            resample: PIL resampling filter
+
+        Returns:
+            PIL Image of the original region at preview size
+        """
+        key = (crop_box, preview_size, resample)
+        cached = self._before_cache
+        if cached is None or cached[0] is not image or cached[1] != key:
+            before_preview = self.resize_preview_region(image, crop_box, preview_size, resample)
+            # Keep a reference to the source image so its identity can't be reused by another image
+            self._before_cache = cached = (image, key, before_preview)
+        return cached[2]
+
+    def get_preview_selection(self, crop_box, preview_size):
+        """Map the selection into the coordinates of the downscaled preview region
+
+        Args:
+            crop_box: (x1, y1, x2, y2) region shown in the preview
+            preview_size: (width, height) of the preview
+
+        Returns:
+            (x1, y1, x2, y2) selection in preview pixels, rounded outwards
+        """
+        scale_x = preview_size[0] / (crop_box[2] - crop_box[0])
+        scale_y = preview_size[1] / (crop_box[3] - crop_box[1])
+        x1, y1, x2, y2 = self.selection_coords
+        return (
+            int((x1 - crop_box[0]) * scale_x),
+            int((y1 - crop_box[1]) * scale_y),
+            math.ceil((x2 - crop_box[0]) * scale_x),
+            math.ceil((y2 - crop_box[1]) * scale_y),
+        )
+
+    @staticmethod
+    def resize_preview_region(image, crop_box, preview_size, resample=PREVIEW_RESAMPLE):
+        """Crop and resize a region for the preview in a single pass
+
+        Args:
+            image: PIL Image
+            crop_box: (x1, y1, x2, y2) region to show
+            preview_size: (width, height) of the preview
+            resample: PIL resampling filter
+
+        Returns:
+            PIL Image at preview size
+        """
+        # PIL can resample directly from a box of the source without an intermediate crop
+        return image.resize(preview_size, resample, box=crop_box)
+
+    def on_preview_canvas_configure(self, event):
+        """Remember the preview canvas width so previews don't have to query Tk"""
+        self._preview_canvas_width = event.width
+
+    def get_preview_crop_box(self, image_size):
+        """Get the preview region: the selection plus a margin, clipped to the image
+
+        Args:
+            image_size: (width, height) of the image being previewed
+
+        Returns:
+            tuple: (x1, y1, x2, y2) crop box
+        """
+        key = (tuple(self.selection_coords), image_size)
+        if self._crop_box_key != key:
+            x1, y1, x2, y2 = self.selection_coords
+            width, height = image_size
+            self._crop_box = (
+                max(0, x1 - PREVIEW_MARGIN),
+                max(0, y1 - PREVIEW_MARGIN),
+                min(width, x2 + PREVIEW_MARGIN),
+                min(height, y2 + PREVIEW_MARGIN),
+            )
+            self._crop_box_key = key
+        return self._crop_box
+
+    def _show_preview(self, before_preview, after_preview):
+        """Show the rendered before/after preview
+
+        Args:
+            before_preview: PIL Image of the original region
+            after_preview: PIL Image of the filled region
+        """
+        # Store both images for the split preview
+        self.before_preview = before_preview
+        self.after_preview = after_preview
+
+        # Reuse the Tk photo images and only copy the new pixels into them
+        photo_key = (after_preview.mode, after_preview.size)
+        photos_replaced = self.preview_photo is None or photo_key != self._preview_photo_key
+        if photos_replaced:
+            self.preview_photo = ImageTk.PhotoImage(*photo_key)
+            self.before_photo = ImageTk.PhotoImage(*photo_key)
+            self._preview_photo_key = photo_key
+        self.preview_photo.paste(after_preview)
+        self.before_photo.paste(before_preview)
+
+        # The canvas items already point at the pasted photos unless they are new or the canvas was cleared
+        if not self.preview_canvas.find_withtag("after"):
+            self.update_preview_canvas()
+            return
+        if photos_replaced:
+            # Point the existing items at the resized photos instead of rebuilding the canvas
+            self.preview_canvas.itemconfigure("after", image=self.preview_photo)
+            self.preview_canvas.itemconfigure("before", image=self.before_photo)
+            zoomed_width = int(self.preview_photo.width() * self.zoom_level)
+            zoomed_height = int(self.preview_photo.height() * self.zoom_level)
+            self.preview_canvas.config(scrollregion=(0, 0, zoomed_width, zoomed_height))
+        self.preview_status.config(text=f"Ready - hover to see original (Zoom: {int(self.zoom_level * 100)}%)")
 
     def update_preview_canvas(self):
         """Update the preview canvas with the processed image"""
@@ -342,30 +667,44 @@ class UIHandlersMixin:
             # Configure canvas scrollregion for the zoomed image
             self.preview_canvas.config(scrollregion=(0, 0, zoomed_width, zoomed_height))
 
-            # Draw the "after" version as the default with a tag for scaling
+            # Both versions share the same spot; hovering only toggles which item is visible
             self.image_item = self.preview_canvas.create_image(
-                0, 0, anchor="nw", image=self.preview_photo, tags=("preview_image",)
+                0, 0, anchor="nw", image=self.preview_photo, tags=("preview_image", "after")
+            )
+            self.before_item = self.preview_canvas.create_image(
+                0, 0, anchor="nw", image=self.before_photo, state="hidden", tags=("preview_image", "before")
             )
 
             # Scale the image if zoomed
             if self.zoom_level != 1.0:
                 self.preview_canvas.scale("preview_image", 0, 0, self.zoom_level, self.zoom_level)
 
-            # Add mouse hover binding to show before/after
-            def on_mouse_enter(event):
-                # Show the "before" version on hover
-                self.preview_canvas.itemconfig(self.image_item, image=self.before_photo)
-                self.is_hovering = True
+            if self.is_hovering:
+                self.show_before_image()
+            else:
+                self.show_after_image()
 
-            def on_mouse_leave(event):
-                # Show the "after" version when not hovering
-                self.preview_canvas.itemconfig(self.image_item, image=self.preview_photo)
-                self.is_hovering = False
+            self.preview_status.config(text=f"Ready - hover to see original (Zoom: {int(self.zoom_level * 100)}%)")
 
-            self.preview_canvas.bind("<Enter>", on_mouse_enter)
-            self.preview_canvas.bind("<Leave>", on_mouse_leave)
+    def show_before_image(self):
+        """Show the original image and hide the filled one"""
+        self.preview_canvas.itemconfigure("before", state="normal")
+        self.preview_canvas.itemconfigure("after", state="hidden")
 
-            self.preview_status.config(text=f"Ready - hover to see original (Zoom: {int(self.zoom_level * 100)}%)")
+    def show_after_image(self):
+        """Show the filled image and hide the original one"""
+        self.preview_canvas.itemconfigure("after", state="normal")
+        self.preview_canvas.itemconfigure("before", state="hidden")
+
+    def on_preview_enter(self, event):
+        """Show the "before" version on hover"""
+        self.show_before_image()
+        self.is_hovering = True
+
+    def on_preview_leave(self, event):
+        """Show the "after" version when not hovering"""
+        self.show_after_image()
+        self.is_hovering = False
 
     def zoom_preview(self, factor):
         """Change the zoom level of the preview
@@ -448,12 +787,10 @@ class UIHandlersMixin:
             if canvas_x <= x < canvas_x + canvas_width and canvas_y <= y < canvas_y + canvas_height:
                 # Mouse is over canvas
                 if not getattr(self, "is_hovering", False):
-                    if hasattr(self, "image_item") and hasattr(self, "before_photo"):
-                        self.preview_canvas.itemconfig(self.image_item, image=self.before_photo)
+                    self.show_before_image()
                     self.is_hovering = True
             else:
                 # Mouse is outside canvas
                 if getattr(self, "is_hovering", False):
-                    if hasattr(self, "image_item") and hasattr(self, "preview_photo"):
-                        self.preview_canvas.itemconfig(self.image_item, image=self.preview_photo)
+                    self.show_after_image()
                     self.is_hovering = False
@@ -1,21 +1,31 @@
 """Utility functions for Enhanced Content-Aware Fill"""
 
+import functools
+import importlib.util
+import sys
+
 
 class UtilsMixin:
     """Mixin class for utility methods"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def check_module_available(module_name):
         """Check if a Python module is available
 
+        The module is located with ``importlib.util.find_spec`` rather than
+        imported, so probing for heavy backends such as PyTorch stays cheap.
+        Results are cached for the lifetime of the process.
+
         Args:
             module_name: Name of the module to check
 
         Returns:
             bool: True if module is available, False otherwise
         """
-        try:
-            __import__(module_name)
+        if module_name in sys.modules:
             return True
-        except ImportError:
+        try:
+            return importlib.util.find_spec(module_name) is not None
+        except (ImportError, ValueError):
             return False
@@ -1,14 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk
+from PIL import Image, ImageOps, ImageTk
+import PIL
+import atexit
+import hashlib
+import logging
 import os
+import shutil
+import tempfile
 import threading
-import queue
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import numpy as np
 
+try:
+    import cv2
+except ImportError:  # OpenCV is optional here; previews are resized with Pillow instead
+    cv2 = None
+
 # Add parent directory to path to ensure imports work
 # Ensure this path adjustment is correct for your project structure
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -32,9 +44,67 @@ except ImportError as e:
         def total_count(self): return 0
     class Card: pass
     def parse_decklist_spec(path): return Decklist()
-    def fetch_scans_scryfall(decklist, faces): return []
+    def fetch_scans_scryfall(decklist, faces, progress_cb=None): return []
     def print_cards_fpdf(*args, **kwargs): raise NotImplementedError("mtgproxies not found")
 
+logger = logging.getLogger(__name__)
+
+# Number of resized card images kept so paging back and forth doesn't decode and resample again.
+# Thumbnails are keyed by (path, mtime, target box), see MTGProxyGUI.fit_target.
+THUMB_CACHE_SIZE = 128
+# Tk keeps 4 bytes per pixel for each PhotoImage; large windows hit this budget before the count above
+THUMB_CACHE_BYTES = 128 * 1024 * 1024
+# Number of decoded card images kept in memory so navigation only pays for the resize.
+# A full 745x1040 RGBA scan takes about 3 MB, so this bounds the cache near 100 MB.
+DECODE_CACHE_SIZE = 32
+# How many cards on each side of the current one are decoded ahead of time
+PREFETCH_DISTANCE = 2
+# Delay before a quick BILINEAR preview is replaced by a LANCZOS one, so resize drags stay smooth
+REFINE_DELAY_MS = 400
+# Frame sizes are rounded down to this many pixels so small resize drags reuse cached thumbnails
+FRAME_BUCKET = 10
+# Margin kept free around the card inside the frame, in pixels
+FRAME_PADDING = 6
+# Bounding box of the reduced copies kept for the session, used when the frame fits inside it
+PREVIEW_SIZE = (600, 840)
+
+# PDF layout in mm, built once; read-only because the same arrays are handed to every print_cards_fpdf call
+_A4_MM = np.array([210.0, 297.0])
+_CARD_MM = np.array([2.5, 3.5]) * 25.4 # Standard MTG card size
+_A4_MM.setflags(write=False)
+_CARD_MM.setflags(write=False)
+
+
+def make_preview(img, path):
+    """Save a copy of a decoded image reduced to PREVIEW_SIZE
+
+    PNG keeps the transparent corners of Scryfall scans. Failures are ignored; the viewer
+    then simply decodes the full image.
+    """
+    try:
+        ImageOps.contain(img, PREVIEW_SIZE, Image.LANCZOS).save(path + ".tmp", "PNG")
+        os.replace(path + ".tmp", path)
+    except Exception as e:
+        print(f"Could not create preview {path}: {e}")
+
+
+class NotifyingQueue(deque):
+    """Message channel that wakes the Tk main loop with a <<WorkerMsg>> event whenever a message is put
+
+    A deque is enough here: append and popleft are atomic in CPython, and the single consumer
+    is woken by the event, so queue.Queue's locks and condition variables would be pure overhead.
+    """
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+
+    def put(self, item):
+        self.append(item)
+        try:
+            self.root.event_generate("<<WorkerMsg>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            pass # Window already closed; nobody is listening
+
 
 class CardWorker:
     def __init__(self, callback_queue):
@@ -63,7 +133,11 @@ class CardWorker:
             self.callback_queue.put(("total", total_cards))
 
             # Fetch scans, this is where the actual Scryfall API calls happen
-            self.images = fetch_scans_scryfall(self.decklist, faces="all") # Returns list of paths
+            self.images = fetch_scans_scryfall( # Returns list of paths
+                self.decklist,
+                faces="all",
+                progress_cb=lambda done, total: self.callback_queue.put(("progress", (done, total))),
+            )
 
             # Signal completion
             self.callback_queue.put(("done", self.images))
@@ -88,8 +162,8 @@ class CardWorker:
             print_cards_fpdf(
                 image_paths, # Pass the list of paths
                 output_path,
-                papersize=np.array([210, 297]),  # A4 in mm
-                cardsize=np.array([2.5, 3.5]) * 25.4,  # Standard MTG card size in mm
+                papersize=_A4_MM,
+                cardsize=_CARD_MM,
                 cropmarks=True
             )
             return True
@@ -107,11 +181,13 @@ class MTGProxyGUI:
         self.root.geometry("800x700")
 
         # Set up callback queue for worker thread
-        self.callback_queue = queue.Queue()
+        self.callback_queue = NotifyingQueue(self.root)
         self.worker = CardWorker(self.callback_queue)
 
         # State variables
         self.current_index = 0
+        self._is_loading = False # A decklist is being fetched by the worker
+        self._btn_state = {} # Button -> state last set through set_button_state
         # self.total_cards = 0 # We'll use len(self.images) directly
         self.images = [] # List to hold image file paths
 
@@ -145,7 +221,7 @@ class MTGProxyGUI:
         self.load_deck_btn = ttk.Button(self.control_frame, text="Load Decklist", command=self.load_decklist)
         self.load_deck_btn.grid(row=0, column=0, sticky="w", padx=(0, 5))
         if not MTGPROXIES_AVAILABLE:
-            self.load_deck_btn.config(state=tk.DISABLED) # Disable if lib not found
+            self.set_button_state(self.load_deck_btn, tk.DISABLED) # Disable if lib not found
 
         # --- NEW BUTTONS ---
         self.add_custom_btn = ttk.Button(self.control_frame, text="Add Custom Image", command=self.add_custom_image)
@@ -163,11 +239,24 @@ class MTGProxyGUI:
         # Row 2: Image display
         self.image_frame = ttk.Frame(root, borderwidth=1, relief="solid")
         self.image_frame.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+        self._frame_size = None # Last size reported by <Configure>, read by get_frame_size
+        self.image_frame.bind("<Configure>", self._on_frame_configure)
 
         # Placeholder for image
         self.image_label = ttk.Label(self.image_frame, text="Load a decklist or add a custom image to start")
         self.image_label.pack(expand=True, fill="both")
         self.current_image = None # Holds the PhotoImage object
+        # (path, mtime, target width, target height) -> PhotoImage, least recently shown first
+        self._thumb_cache = OrderedDict()
+        self._thumb_bytes = 0 # Tk memory held by _thumb_cache
+        # path -> (decoded PIL Image, frame size a JPEG was draft-decoded for or None, file st_mtime_ns),
+        # least recently shown first
+        self._pil_cache = OrderedDict()
+        self._cache_lock = threading.Lock() # The prefetch threads fill _pil_cache too
+        self._preview_dir = None # Session directory of reduced copies, see preview_path
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._refine_job = None # Pending high-quality resize of the shown card
+        self._last_rendered = None # (cache_key, width, height) of the image in the label
 
         # Progress bar (initially hidden)
         self.progress_var = tk.DoubleVar()
@@ -194,22 +283,38 @@ class MTGProxyGUI:
         self.save_pdf_btn = ttk.Button(root, text="Save to PDF", command=self.save_to_pdf, state=tk.DISABLED)
         self.save_pdf_btn.grid(row=4, column=0, sticky="ew", padx=5, pady=5)
         if not MTGPROXIES_AVAILABLE:
-            self.save_pdf_btn.config(state=tk.DISABLED) # Disable if lib not found
+            self.set_button_state(self.save_pdf_btn, tk.DISABLED) # Disable if lib not found
 
         # Create card_images directory if it doesn't exist
-        os.makedirs("./card_images", exist_ok=True)
+        Path("./card_images").mkdir(exist_ok=True)
 
-        # Start polling the callback queue
-        self.poll_queue()
+        # Handle worker messages as they arrive instead of polling the queue
+        self.root.bind("<<WorkerMsg>>", self._drain_queue)
+
+        # Load the file dialog code once the window is up, so the first Load/Add click opens it straight away
+        self.root.after_idle(self._warm_up_file_dialog)
 
         # Bind closing event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
-    def poll_queue(self):
-        """Check for messages from the worker thread"""
+    def _warm_up_file_dialog(self):
+        """Preload Tk's script-based file dialog
+
+        On X11, tk_getOpenFile is implemented in Tcl and sourced on first use. Windows and macOS
+        use native dialogs that cannot be prepared without showing them, so nothing is done there.
+        Tk isn't thread-safe for this, so it runs on the main loop while the window is idle.
+        """
+        try:
+            if self.root.tk.call("tk", "windowingsystem") == "x11":
+                self.root.tk.call("auto_load", "::tk::dialog::file::")
+        except tk.TclError:
+            pass # Warm-up is best effort; the dialog still loads on first use
+
+    def _drain_queue(self, event=None):
+        """Handle every message currently queued by the worker thread"""
         try:
             while True:
-                message, data = self.callback_queue.get_nowait()
+                message, data = self.callback_queue.popleft()
                 if message == "total":
                     # self.total_cards = data # Use len(self.images) instead
                     self.counter_label.config(text=f"Loading.../{data}") # Initial count display
@@ -220,13 +325,12 @@ class MTGProxyGUI:
                     self.progress_bar.pack(fill="x", padx=50, pady=10)
 
                 elif message == "progress":
-                    # This might not be sent by the default fetch_scans_scryfall
-                    pass
-                    # percentage = (data / self.total_cards) * 100
-                    # self.progress_var.set(percentage)
-                    # self.progress_text.config(text=f"Loading cards... {data}/{self.total_cards}")
+                    done, total = data # Scans downloaded so far, out of the unique scans in the deck
+                    self.progress_var.set(done / total * 100)
+                    self.progress_text.config(text=f"Loading cards... {done}/{total}")
 
                 elif message == "done":
+                    self._is_loading = False
                     self.images = list(data) # Ensure it's a mutable list of paths
                     # Hide progress and show first image
                     self.progress_bar.pack_forget()
@@ -243,12 +347,13 @@ class MTGProxyGUI:
                          self.update_button_states() # Update even if empty
 
                     # Re-enable load/add buttons
-                    if MTGPROXIES_AVAILABLE: self.load_deck_btn.config(state=tk.NORMAL)
-                    self.add_custom_btn.config(state=tk.NORMAL)
-                    self.add_new_card_btn.config(state=tk.NORMAL)
+                    if MTGPROXIES_AVAILABLE: self.set_button_state(self.load_deck_btn, tk.NORMAL)
+                    self.set_button_state(self.add_custom_btn, tk.NORMAL)
+                    self.set_button_state(self.add_new_card_btn, tk.NORMAL)
 
 
                 elif message == "error":
+                    self._is_loading = False
                     # Hide progress and show error
                     self.progress_bar.pack_forget()
                     self.progress_text.pack_forget()
@@ -256,19 +361,14 @@ class MTGProxyGUI:
                     self.image_label.config(text=f"Error: {data}", image="") # Clear any previous image
                     messagebox.showerror("Error", f"An error occurred: {data}")
                     # Re-enable load/add buttons
-                    if MTGPROXIES_AVAILABLE: self.load_deck_btn.config(state=tk.NORMAL)
-                    self.add_custom_btn.config(state=tk.NORMAL)
-                    self.add_new_card_btn.config(state=tk.NORMAL)
+                    if MTGPROXIES_AVAILABLE: self.set_button_state(self.load_deck_btn, tk.NORMAL)
+                    self.set_button_state(self.add_custom_btn, tk.NORMAL)
+                    self.set_button_state(self.add_new_card_btn, tk.NORMAL)
                     # Disable other buttons
                     self.update_button_states()
 
-
-                self.callback_queue.task_done()
-        except queue.Empty:
-            pass
-
-        # Check again after 100ms
-        self.root.after(100, self.poll_queue)
+        except IndexError:
+            pass # Queue drained
 
     def load_decklist(self):
         """Open a file dialog to select a decklist"""
@@ -282,16 +382,23 @@ class MTGProxyGUI:
         )
         if file_path:
             # Disable buttons during loading
-            self.load_deck_btn.config(state=tk.DISABLED)
-            self.add_custom_btn.config(state=tk.DISABLED)
-            self.add_new_card_btn.config(state=tk.DISABLED)
-            self.prev_btn.config(state=tk.DISABLED)
-            self.next_btn.config(state=tk.DISABLED)
-            self.edit_btn.config(state=tk.DISABLED)
-            self.save_pdf_btn.config(state=tk.DISABLED)
+            self._is_loading = True
+            self.set_button_state(self.load_deck_btn, tk.DISABLED)
+            self.set_button_state(self.add_custom_btn, tk.DISABLED)
+            self.set_button_state(self.add_new_card_btn, tk.DISABLED)
+            self.set_button_state(self.prev_btn, tk.DISABLED)
+            self.set_button_state(self.next_btn, tk.DISABLED)
+            self.set_button_state(self.edit_btn, tk.DISABLED)
+            self.set_button_state(self.save_pdf_btn, tk.DISABLED)
             self.image_label.config(text="Loading...", image="") # Clear image
-
-            # Reset state
+            self.current_image = None
+
+            # Reset state; prefetches queued for the old deck are no longer useful
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+            self.clear_thumbs()
+            with self._cache_lock:
+                self._pil_cache.clear()
             self.current_index = 0
             self.images = []
             self.counter_label.config(text="Loading...")
@@ -311,9 +418,8 @@ class MTGProxyGUI:
                  messagebox.showerror("Error", f"File not found: {file_path}")
                  return
             try:
-                # Check if it's a valid image
-                with Image.open(file_path) as img:
-                    img.verify() # Verify headers
+                # Decoding checks it's a valid image and leaves it in the cache for the display below
+                self.load_image(file_path, self.get_frame_size())
                 # Add the path to the list
                 self.images.append(file_path)
                 self.current_index = len(self.images) - 1 # Go to the new image
@@ -350,10 +456,15 @@ class MTGProxyGUI:
             return
 
         try:
-            # Use a new PIL Image object to ensure we're loading the latest version
-            with open(image_path, 'rb') as f:
-                img = Image.open(f).copy() # Load fresh copy
-            self.display_image(img) # Resize and show
+            # The modification time is part of the thumbnail key and load_image checks it too,
+            # so edited files are shown fresh
+            mtime = os.path.getmtime(image_path)
+            frame_size = self.get_frame_size()
+            # A cached thumbnail needs no decoded image at all
+            cached = (image_path, mtime) + self.fit_target(frame_size) in self._thumb_cache
+            img = None if cached else self.load_image(image_path, frame_size)
+            self.display_image(img, cache_key=(image_path, mtime), frame_size=frame_size) # Resize and show
+            self.prefetch_neighbors(frame_size)
 
         except Exception as e:
             self.image_label.config(text=f"Failed to load image:\n{image_path}\n{e}", image="")
@@ -363,57 +474,264 @@ class MTGProxyGUI:
             self.update_button_states()
 
 
-    def display_image(self, img):
-        """Resize and display a PIL image in the image label"""
-        try:
-            # Resize image to fit the frame while maintaining aspect ratio
-            img_width, img_height = img.size
-            # Crucial: Update geometry manager to get actual frame size
-            self.image_frame.update_idletasks()
+    def _on_frame_configure(self, event):
+        """Remember the image frame size so redraws don't have to force a layout pass to query it"""
+        self._frame_size = (event.width, event.height)
+
+
+    def get_frame_size(self):
+        """Return the (width, height) available for the card image"""
+        if self._frame_size is not None:
+            frame_width, frame_height = self._frame_size
+        else:
             frame_width = self.image_frame.winfo_width()
             frame_height = self.image_frame.winfo_height()
 
-            # If frame hasn't been drawn yet or is tiny, use reasonable defaults
-            if frame_width <= 10: frame_width = 600
-            if frame_height <= 10: frame_height = 400
+        # If frame hasn't been drawn yet or is tiny, use reasonable defaults
+        if frame_width <= 10: frame_width = 600
+        if frame_height <= 10: frame_height = 400
+        return frame_width, frame_height
+
+
+    def load_image(self, image_path, draft_size=None):
+        """Return the decoded PIL image for a path, decoding the file only on a cache miss
+
+        When ``draft_size`` fits in PREVIEW_SIZE and an up-to-date preview copy exists, the
+        preview is decoded instead of the full scan. Otherwise JPEGs are decoded at reduced
+        scale (1/2, 1/4 or 1/8) when that still covers ``draft_size``, which makes libjpeg
+        skip most of the IDCT work. Other formats are decoded in full, and a preview copy is
+        then written in the background for the next cache miss.
+
+        Args:
+            image_path: Path of the card image file
+            draft_size: (width, height) the image will be shown at, or None for full resolution
+
+        Returns:
+            PIL.Image.Image: Fully loaded image
+        """
+        # A decode is only reused while the file is unchanged, including edits made outside this program
+        mtime_ns = os.stat(image_path).st_mtime_ns
+        with self._cache_lock:
+            entry = self._pil_cache.get(image_path)
+            if entry is not None and entry[2] == mtime_ns:
+                img, drafted_for, _ = entry
+                # A reduced decode is only reusable if it was made for a frame at least this large
+                if drafted_for is None or (
+                        draft_size is not None
+                        and drafted_for[0] >= draft_size[0] and drafted_for[1] >= draft_size[1]):
+                    self._pil_cache.move_to_end(image_path)
+                    return img
+
+        # Decode outside the lock so a prefetch doesn't block the UI thread
+        source, drafted_for, preview = image_path, None, None
+        if draft_size is not None and draft_size[0] <= PREVIEW_SIZE[0] and draft_size[1] <= PREVIEW_SIZE[1]:
+            preview = self.preview_path(image_path)
+            try:
+                if os.stat(preview).st_mtime_ns >= mtime_ns: # Stale after an edit
+                    source, drafted_for = preview, PREVIEW_SIZE
+            except OSError:
+                pass # No preview of this file yet
+        img = Image.open(source)
+        if drafted_for is None and draft_size is not None and img.format == "JPEG":
+            full_size = img.size
+            img.draft("RGB", draft_size)
+            if img.size != full_size:
+                drafted_for = draft_size
+        img.load() # Decode now; this also closes the file handle
+        # Normalise once here so every later resize and PhotoImage works on a ready RGB(A) buffer
+        ImageOps.exif_transpose(img, in_place=True)
+        if img.mode not in ("RGB", "RGBA"):
+            has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        if (preview is not None and source == image_path and drafted_for is None
+                and (img.width > PREVIEW_SIZE[0] or img.height > PREVIEW_SIZE[1])):
+            try:
+                self._prefetch_pool.submit(make_preview, img, preview)
+            except RuntimeError:
+                pass # The pool was shut down for a new decklist
+        with self._cache_lock:
+            self._pil_cache[image_path] = (img, drafted_for, mtime_ns)
+            if len(self._pil_cache) > DECODE_CACHE_SIZE:
+                self._pil_cache.popitem(last=False)
+        return img
+
+
+    def preview_path(self, image_path):
+        """Return where the reduced preview copy of an image file is kept
+
+        Previews live in a temporary directory created on first use and removed when the program exits,
+        so they never accumulate next to the scans.
+        """
+        with self._cache_lock:
+            if self._preview_dir is None:
+                self._preview_dir = tempfile.mkdtemp(prefix="mtg-proxies-previews-")
+                atexit.register(shutil.rmtree, self._preview_dir, ignore_errors=True)
+        name = hashlib.sha1(os.path.abspath(image_path).encode()).hexdigest()
+        return os.path.join(self._preview_dir, name + ".png")
+
+
+    def prefetch_neighbors(self, frame_size):
+        """Decode the cards around the current one in the background so navigation doesn't wait on disk"""
+        for offset in (1, -1, 2, -2)[:2 * PREFETCH_DISTANCE]:
+            index = self.current_index + offset
+            if 0 <= index < len(self.images):
+                self._prefetch_pool.submit(self._prefetch, self.images[index], frame_size)
+
+
+    def _prefetch(self, image_path, frame_size):
+        """Worker-thread body of prefetch_neighbors; cached decodes of unchanged files return at once"""
+        try:
+            self.load_image(image_path, frame_size)
+        except Exception:
+            pass # Missing or broken files are reported when the card is actually shown
+
+
+    @staticmethod
+    def fit_target(frame_size):
+        """Return the (width, height) box a card is fitted into for a frame size
 
-            # Calculate scaling factor
-            width_ratio = frame_width / img_width
-            height_ratio = frame_height / img_height
-            scale_factor = min(width_ratio, height_ratio, 1.0) # Don't scale up beyond 1.0 implicitly
+        The frame is rounded down to FRAME_BUCKET steps and a fixed FRAME_PADDING margin is kept.
+        Thumbnails are cached per target box, so small resize drags reuse them.
+        """
+        frame_width, frame_height = frame_size
+        target_width = max(1, frame_width // FRAME_BUCKET * FRAME_BUCKET - FRAME_PADDING)
+        target_height = max(1, frame_height // FRAME_BUCKET * FRAME_BUCKET - FRAME_PADDING)
+        return target_width, target_height
 
-            new_width = max(1, int(img_width * scale_factor * 0.95))  # 95% of available space, min 1 pixel
-            new_height = max(1, int(img_height * scale_factor * 0.95))
 
-            resized_img = img.resize((new_width, new_height), Image.LANCZOS)
-            self.current_image = ImageTk.PhotoImage(resized_img) # Store reference
+    def display_image(self, img, cache_key=None, frame_size=None):
+        """Resize and display a PIL image in the image label
+
+        Args:
+            img: PIL Image to show; may be None when a thumbnail for ``cache_key`` is cached
+            cache_key: (path, mtime) identifying the image file; resized images are cached under it
+            frame_size: (width, height) to fit into, queried from the frame if None
+        """
+        try:
+            target = self.fit_target(frame_size or self.get_frame_size())
+
+            # Redraws of an unchanged card at an unchanged size would only build an identical PhotoImage
+            rendered = (cache_key, target)
+            if (cache_key is not None and rendered == self._last_rendered
+                    and str(self.image_label.cget("image")) == str(self.current_image)):
+                return
+
+            if self._refine_job is not None:
+                self.root.after_cancel(self._refine_job)
+                self._refine_job = None
+
+            # Only LANCZOS results are cached; a miss shows a cheap BILINEAR resize until the view settles
+            key = None if cache_key is None else cache_key + target
+            photo = self._thumb_cache.get(key) if key is not None else None
+            if photo is None:
+                # Fit the image into the target box while maintaining aspect ratio
+                img_width, img_height = img.size
+                scale_factor = min(target[0] / img_width, target[1] / img_height, 1.0) # Never scale up
+                size = (max(1, round(img_width * scale_factor)), max(1, round(img_height * scale_factor)))
+
+                photo = ImageTk.PhotoImage(self.quick_resize(img, size))
+                self._refine_job = self.root.after(REFINE_DELAY_MS, self._refine_image, img, size, key, photo)
+            else:
+                self._thumb_cache.move_to_end(key)
+            self.current_image = photo # Store reference
 
             # Update the image in the label
             self.image_label.config(image=self.current_image, text="")
+            self._last_rendered = rendered
         except Exception as e:
              print(f"Error displaying image: {e}")
              self.image_label.config(image="", text=f"Error displaying image: {e}")
              self.current_image = None
 
 
+    @staticmethod
+    def quick_resize(img, size):
+        """Resize a PIL image for the interactive preview, favouring speed over the last bit of quality
+
+        Args:
+            img: PIL Image to resize
+            size: (width, height) of the result
+
+        Returns:
+            PIL.Image.Image: Resized image
+        """
+        if cv2 is not None and img.mode in ("L", "RGB", "RGBA"):
+            # OpenCV's SIMD resize works on PIL's HxWxC uint8 layout as-is
+            downscale = size[0] <= img.width and size[1] <= img.height
+            interpolation = cv2.INTER_AREA if downscale else cv2.INTER_LINEAR
+            return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=interpolation))
+        # reducing_gap first shrinks by an integer factor with a box filter, which is much cheaper
+        # than running the full filter over the source; the LANCZOS refine pass doesn't take the shortcut
+        return img.resize(size, Image.BILINEAR, reducing_gap=2.0)
+
+
+    def _refine_image(self, img, size, key, preview):
+        """Replace the quick preview of the shown card with a LANCZOS resize and cache it"""
+        self._refine_job = None
+        if str(self.image_label.cget("image")) != str(preview):
+            return # The label was cleared or shows something else by now
+        try:
+            photo = ImageTk.PhotoImage(img.resize(size, Image.LANCZOS))
+        except Exception as e:
+            print(f"Error refining image: {e}")
+            return
+        if key is not None:
+            self.cache_thumb(key, photo)
+        self.current_image = photo
+        self.image_label.config(image=self.current_image, text="")
+
+
+    def cache_thumb(self, key, photo):
+        """Add a resized card to the thumbnail cache, evicting the least recently shown ones over budget"""
+        self._thumb_cache[key] = photo
+        self._thumb_bytes += photo.width() * photo.height() * 4
+        while len(self._thumb_cache) > 1 and (
+                len(self._thumb_cache) > THUMB_CACHE_SIZE or self._thumb_bytes > THUMB_CACHE_BYTES):
+            _, evicted = self._thumb_cache.popitem(last=False)
+            self._thumb_bytes -= evicted.width() * evicted.height() * 4
+            # Dropping the last reference deletes the Tk image right away
+
+
+    def clear_thumbs(self, image_path=None):
+        """Release cached thumbnails of one image file, or all of them
+
+        Args:
+            image_path: Path whose thumbnails are dropped, e.g. after an edit; None drops every thumbnail
+        """
+        if image_path is None:
+            self._thumb_cache.clear()
+            self._thumb_bytes = 0
+            return
+        for key in [key for key in self._thumb_cache if key[0] == image_path]:
+            photo = self._thumb_cache.pop(key)
+            self._thumb_bytes -= photo.width() * photo.height() * 4
+
+
+    def set_button_state(self, button, state):
+        """Set a button's state, skipping the Tk call when it already has that state"""
+        if self._btn_state.get(button) != state:
+            button.config(state=state)
+            self._btn_state[button] = state
+
+
     def update_button_states(self):
         """Centralized function to update button states based on current state"""
         has_images = bool(self.images)
         num_images = len(self.images)
 
         # Navigation buttons
-        self.prev_btn.config(state=tk.NORMAL if has_images and self.current_index > 0 else tk.DISABLED)
-        self.next_btn.config(state=tk.NORMAL if has_images and self.current_index < num_images - 1 else tk.DISABLED)
+        can_go_next = has_images and self.current_index < num_images - 1
+        self.set_button_state(self.prev_btn, tk.NORMAL if has_images and self.current_index > 0 else tk.DISABLED)
+        self.set_button_state(self.next_btn, tk.NORMAL if can_go_next else tk.DISABLED)
 
         # Edit and Save buttons (require images and potentially the library for saving)
-        self.edit_btn.config(state=tk.NORMAL if has_images else tk.DISABLED)
+        self.set_button_state(self.edit_btn, tk.NORMAL if has_images else tk.DISABLED)
         can_save = has_images and MTGPROXIES_AVAILABLE
-        self.save_pdf_btn.config(state=tk.NORMAL if can_save else tk.DISABLED)
+        self.set_button_state(self.save_pdf_btn, tk.NORMAL if can_save else tk.DISABLED)
 
         # Add buttons are generally always enabled unless during load
-        is_loading = self.load_deck_btn['state'] == tk.DISABLED # Check if loading is active
-        self.add_custom_btn.config(state=tk.DISABLED if is_loading else tk.NORMAL)
-        self.add_new_card_btn.config(state=tk.DISABLED if is_loading else tk.NORMAL)
+        self.set_button_state(self.add_custom_btn, tk.DISABLED if self._is_loading else tk.NORMAL)
+        self.set_button_state(self.add_new_card_btn, tk.DISABLED if self._is_loading else tk.NORMAL)
 
 
     def previous_card(self):
@@ -454,8 +772,13 @@ class MTGProxyGUI:
                 # For now, assume it overwrites or we just reload current index.
                 # self.images[self.current_index] = saved_path # Uncomment if editor returns new path
 
-                # Refresh the display to show the potentially updated image
+                # Drop the stale decoded copy and thumbnails, then refresh the display to show the updated image
                 # Schedule the refresh in the main loop
+                with self._cache_lock:
+                    self._pil_cache.pop(saved_path, None)
+                    self._pil_cache.pop(image_path, None)
+                self.clear_thumbs(saved_path)
+                self.clear_thumbs(image_path)
                 self.root.after(50, self.display_current_card)
 
             # Launch the editor with the current image path and callback
@@ -480,7 +803,7 @@ class MTGProxyGUI:
             return
 
         # Verify all image paths exist before attempting to save
-        missing_files = [p for p in self.images if not os.path.exists(p)]
+        missing_files = self._find_missing_files(self.images)
         if missing_files:
              messagebox.showerror("Missing Files", "Cannot save PDF. The following image files are missing:\n\n" + "\n".join(missing_files))
              return
@@ -492,7 +815,7 @@ class MTGProxyGUI:
         )
         if save_path:
             # Disable the button during saving
-            self.save_pdf_btn.config(state=tk.DISABLED)
+            self.set_button_state(self.save_pdf_btn, tk.DISABLED)
             # Pass the current list of image paths
             paths_to_save = list(self.images)
 
@@ -504,6 +827,18 @@ class MTGProxyGUI:
 
             threading.Thread(target=save_thread, daemon=True).start()
 
+    @staticmethod
+    def _find_missing_files(paths):
+        """Return the paths that don't exist, listing each distinct directory once instead of a stat per card"""
+        existing = set()
+        for directory in {os.path.dirname(os.path.abspath(p)) for p in paths}:
+            try:
+                with os.scandir(directory) as entries:
+                    existing.update(os.path.normcase(entry.path) for entry in entries)
+            except OSError:
+                pass # Directory is gone; every file in it is missing
+        return [p for p in paths if os.path.normcase(os.path.abspath(p)) not in existing]
+
     def _save_complete(self, success, path):
         """Called when save is complete"""
         # Re-enable button only if conditions are still met
@@ -521,8 +856,10 @@ class MTGProxyGUI:
         if token:
             try:
                 # Save token to a config file (consider a more robust config method)
-                with open("token.txt", "w") as f:
-                    f.write(token)
+                # Written beside the target and renamed over it, so a failed write never leaves a truncated token
+                tmp_path = Path("token.txt.tmp")
+                tmp_path.write_text(token)
+                tmp_path.replace("token.txt")
                 messagebox.showinfo("Token Saved", "API token has been saved (token.txt)")
             except Exception as e:
                  messagebox.showerror("Error", f"Failed to save token: {e}")
@@ -540,16 +877,23 @@ class MTGProxyGUI:
 
 
 if __name__ == "__main__":
+    # Pillow-SIMD versions carry a ".postN" suffix
+    logger.debug("Using %s %s", "Pillow-SIMD" if "post" in PIL.__version__ else "Pillow", PIL.__version__)
     root = tk.Tk()
     app = MTGProxyGUI(root)
     # Handle resizing events to update the displayed image
     def on_resize(event):
+        # <Configure> also fires for moves and repeated layouts; only a new size needs a redraw
+        size = (event.width, event.height)
+        if size == getattr(app, '_pending_size', None):
+            return
+        app._pending_size = size
         # Add a small delay to avoid excessive updates during resize drag
         if hasattr(app, '_resize_job'):
              root.after_cancel(app._resize_job)
         app._resize_job = root.after(250, app.display_current_card) # Call display_current which calls display_image
 
     # Bind configure only to the image frame as that's the relevant size
-    app.image_frame.bind("<Configure>", on_resize)
+    app.image_frame.bind("<Configure>", on_resize, add="+")
 
     root.mainloop()
\ No newline at end of file
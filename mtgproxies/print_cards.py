@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -11,6 +12,8 @@ from tqdm import tqdm
 from mtgproxies.plotting import SplitPages
 
 image_size = np.array([745, 1040])
+# Below this many missing crops, handing them to worker threads costs more than it saves
+_PARALLEL_CROP_MIN = 8
 
 
 def _occupied_space(cardsize, pos, border_crop: int, closed: bool = False):
@@ -97,6 +100,15 @@ def print_cards_matplotlib(
             plt.close()
 
 
+def _cropped_path(image: str | Path, left: int, top: int) -> str:
+    path = Path(image)
+    return str(path.parent / (path.stem + f"_{left}_{top}" + path.suffix))
+
+
+def _crop_image(image: str | Path, cropped_image: str, left: int, top: int) -> None:
+    plt.imsave(cropped_image, plt.imread(image)[top:, left:])
+
+
 def print_cards_fpdf(
     images: list[str | Path],
     filepath: str | Path,
@@ -128,6 +140,41 @@ def print_cards_fpdf(
     filepath = Path(filepath)
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
+    # Every sheet has the same layout, so the placement of each slot is computed once, vectorized.
+    # Cards are cropped left and top if not on the border of the sheet.
+    slots = np.arange(cards_per_sheet)
+    pos = np.stack([slots % N[0], slots // N[0]], axis=1)
+    crop = np.where(pos > 0, border_crop, 0)
+    slot_crops = crop.tolist()
+    slot_lower = (offset + _occupied_space(cardsize, pos, border_crop)).tolist()
+    slot_size = (cardsize * (image_size - crop) / image_size).tolist()
+
+    # Crop mark positions, shared by all sheets
+    a = cardsize * (image_size - 2 * border_crop) / image_size
+    b = papersize - N * a
+    marks = [(b / 2 + a * [x, y]).tolist() for x in range(N[0] + 1) for y in range(N[1] + 1)]
+
+    # Cards away from the sheet's top/left border are cropped; the crops are cached next to the
+    # images. Decoding and re-encoding them is the slow part, so missing crops are made in parallel.
+    # Threads rather than processes: PNG decoding and encoding release the GIL, and forking a process
+    # that runs other threads (such as the Tk GUI) is unsafe.
+    crops = {}
+    for i, image in enumerate(images):
+        left, top = slot_crops[i % cards_per_sheet]
+        if left != 0 or top != 0:
+            crops[_cropped_path(image, left, top)] = (image, left, top)
+    missing = [
+        (image, cropped_image, left, top)
+        for cropped_image, (image, left, top) in crops.items()
+        if not Path(cropped_image).is_file()
+    ]
+    if len(missing) >= _PARALLEL_CROP_MIN:
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(_crop_image, *zip(*missing)))
+    else:
+        for args in missing:
+            _crop_image(*args)
+
     # Initialize PDF
     pdf = FPDF(orientation="P", unit="mm", format="A4")
 
@@ -138,25 +185,10 @@ def print_cards_fpdf(
                 pdf.set_fill_color(*background_color)
                 pdf.rect(0, 0, papersize[0], papersize[1], "F")
 
-        x = (i % cards_per_sheet) % N[0]
-        y = (i % cards_per_sheet) // N[0]
-
-        # Crop left and top if not on border of sheet
-        left = border_crop if x > 0 else 0
-        top = border_crop if y > 0 else 0
-
-        if left == 0 and top == 0:
-            cropped_image = image
-        else:
-            path = Path(image)
-            cropped_image = str(path.parent / (path.stem + f"_{left}_{top}" + path.suffix))
-            if not Path(cropped_image).is_file():
-                # Crop image
-                plt.imsave(cropped_image, plt.imread(image)[top:, left:])
-
-        # Compute extent
-        lower = offset + _occupied_space(cardsize, np.array([x, y]), border_crop)
-        size = cardsize * (image_size - [left, top]) / image_size
+        slot = i % cards_per_sheet
+        left, top = slot_crops[slot]
+        cropped_image = image if left == 0 and top == 0 else _cropped_path(image, left, top)
+        lower, size = slot_lower[slot], slot_size[slot]
 
         # Plot image
         pdf.image(cropped_image, x=lower[0], y=lower[1], w=size[0], h=size[1])
@@ -165,13 +197,9 @@ def print_cards_fpdf(
             # If this was the last card on a page, add crop marks
             pdf.set_line_width(0.05)
             pdf.set_draw_color(255, 255, 255)
-            a = cardsize * (image_size - 2 * border_crop) / image_size
-            b = papersize - N * a
-            for x in range(N[0] + 1):
-                for y in range(N[1] + 1):
-                    mark = b / 2 + a * [x, y]
-                    pdf.line(mark[0] - 0.5, mark[1], mark[0] + 0.5, mark[1])
-                    pdf.line(mark[0], mark[1] - 0.5, mark[0], mark[1] + 0.5)
+            for mark in marks:
+                pdf.line(mark[0] - 0.5, mark[1], mark[0] + 0.5, mark[1])
+                pdf.line(mark[0], mark[1] - 0.5, mark[0], mark[1] + 0.5)
 
     tqdm.write(f"Writing to {filepath}")
     pdf.output(filepath)
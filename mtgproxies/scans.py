@@ -1,27 +1,58 @@
 from __future__ import annotations
 
-from typing import Literal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Literal
 
 from tqdm import tqdm
 
 import scryfall
 from mtgproxies.decklists.decklist import Decklist
 
+# Concurrent scan downloads. A few connections hide the per-request latency of the cards.scryfall.io CDN
+# without flooding it; anything on api.scryfall.com is still spaced out by scryfall's rate limiter.
+FETCH_WORKERS = 4
 
-def fetch_scans_scryfall(decklist: Decklist, faces: Literal["all", "front", "back"] = "all") -> list[str]:
+
+def fetch_scans_scryfall(
+    decklist: Decklist,
+    faces: Literal["all", "front", "back"] = "all",
+    progress_cb: Callable[[int, int], None] | None = None,
+) -> list[str]:
     """Search Scryfall for scans of a decklist.
 
+    Downloads run on up to FETCH_WORKERS threads, and each distinct scan is fetched once, even when
+    the same printing appears on several decklist lines.
+
     Args:
         decklist: The decklist to fetch scans for
         faces: Which faces to fetch ("all", "front", "back")
+        progress_cb: Called with (fetched, total) as each distinct scan finishes, from the calling thread
 
     Returns:
-        List: List of image files
+        List: List of image files, in decklist order with one entry per copy
     """
-    return [
-        scan
-        for card in tqdm(decklist.cards, desc="Fetching artwork")
+    image_uris = [
+        (image_uri["png"], card.count)
+        for card in decklist.cards
         for i, image_uri in enumerate(card.image_uris)
-        for scan in [scryfall.get_image(image_uri["png"], silent=True)] * card.count
         if faces == "all" or (faces == "front" and i == 0) or (faces == "back" and i > 0)
     ]
+    unique_uris = list(dict.fromkeys(image_uri for image_uri, _ in image_uris))
+
+    # One directory scan notices scans deleted since the last fetch, without a stat per card
+    scryfall.refresh_cache_index()
+
+    paths = {}
+    pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        futures = {pool.submit(scryfall.get_image, image_uri, silent=True): image_uri for image_uri in unique_uris}
+        completed = tqdm(as_completed(futures), total=len(futures), desc="Fetching artwork")
+        for fetched, future in enumerate(completed, 1):
+            paths[futures[future]] = future.result()
+            if progress_cb is not None:
+                progress_cb(fetched, len(unique_uris))
+    finally:
+        # After a failed download, the scans that have not started yet are dropped
+        pool.shutdown(cancel_futures=True)
+
+    return [paths[image_uri] for image_uri, count in image_uris for _ in range(count)]
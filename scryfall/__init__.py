@@ -9,6 +9,7 @@ from scryfall.scryfall import (
     get_price,
     oracle_ids_by_name,
     recommend_print,
+    refresh_cache_index,
     search,
 )
 
@@ -24,4 +25,5 @@ __all__ = [
     "cards_by_oracle_id",
     "oracle_ids_by_name",
     "get_price",
+    "refresh_cache_index",
 ]
@@ -7,6 +7,7 @@ See:
 from __future__ import annotations
 
 import json
+import os
 import pickle
 import threading
 from collections import defaultdict
@@ -16,6 +17,7 @@ from tempfile import gettempdir
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 from scryfall.rate_limit import RateLimiter
@@ -23,8 +25,25 @@ from scryfall.rate_limit import RateLimiter
 # Change cache location from temp directory to ./card_images
 cache = Path("./card_images")
 cache.mkdir(parents=True, exist_ok=True)  # Create cache folder
+
+
+def _scan_cache() -> set[str]:
+    return {entry.name for entry in os.scandir(cache) if entry.is_file() and not entry.name.endswith(".tmp")}
+
+
+# Names of the files already in the cache, read with a single directory scan instead of one stat per card.
+# Hits are trusted; refresh_cache_index() picks up files removed behind the cache's back.
+_cached_files = _scan_cache()
 scryfall_rate_limiter = RateLimiter(delay=0.1)
-_download_lock = threading.Lock()
+# Shared session so downloads reuse keep-alive connections; the pool is sized for parallel scan downloads
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+# Scryfall asks API clients to identify themselves and to send an Accept header
+_session.headers.update({"User-Agent": "mtg-proxies", "Accept": "*/*"})
+# One [lock, users] entry per file being downloaded, so different files can download concurrently while the
+# same file is fetched once. Entries are dropped when their last user is done.
+_download_locks = {}
+_download_locks_lock = threading.Lock()
 
 
 def get_image(image_uri: str, silent: bool = False) -> str:
@@ -43,30 +62,62 @@ def get_image(image_uri: str, silent: bool = False) -> str:
 def get_file(file_name: str, url: str, silent: bool = False) -> str:
     """Download a file and return the path to a local copy.
 
-    Uses cache and Scryfall API call rate limit.
+    Uses cache and Scryfall API call rate limit. The file is downloaded next to its final
+    name and moved into place once complete, so an interrupted download never leaves a
+    truncated file in the cache.
 
     Returns:
         string: Path to local file.
     """
     file_path = cache / file_name
-    with _download_lock:
-        if not file_path.is_file():
-            if "api.scryfall.com" in url:  # Apply rate limit
-                with scryfall_rate_limiter:
-                    download(url, file_path, silent=silent)
-            else:
-                download(url, file_path, silent=silent)
+    if file_name in _cached_files:
+        return str(file_path)
+
+    with _download_locks_lock:
+        entry = _download_locks.setdefault(file_name, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            if not file_path.is_file():
+                tmp_path = file_path.with_name(file_name + ".tmp")
+                try:
+                    if "api.scryfall.com" in url:  # Apply rate limit
+                        with scryfall_rate_limiter:
+                            download(url, tmp_path, silent=silent)
+                    else:
+                        download(url, tmp_path, silent=silent)
+                    os.replace(tmp_path, file_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+            _cached_files.add(file_name)
+    finally:
+        with _download_locks_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _download_locks[file_name]
 
     return str(file_path)
 
 
+def refresh_cache_index() -> None:
+    """Re-read the names of the cached files with a single directory scan.
+
+    get_file trusts its index, so files deleted from the cache since the last scan would be
+    returned without being downloaded again. Call this before a batch of get_file calls.
+    """
+    present = _scan_cache()
+    # Updated in place, so concurrent lookups never see an empty index
+    _cached_files.intersection_update(present)
+    _cached_files.update(present)
+
+
 def download(url: str, dst, chunk_size: int = 1024 * 4, silent: bool = False):
     """Download a file with a tqdm progress bar."""
-    with requests.get(url, stream=True) as req:
+    with _session.get(url, stream=True) as req:
         req.raise_for_status()
         file_size = int(req.headers["Content-Length"]) if "Content-Length" in req.headers else None
         with (
-            open(dst, "xb") as f,
+            open(dst, "wb") as f,
             tqdm(
                 total=file_size,
                 unit="B",
@@ -90,7 +141,7 @@ def depaginate(url: str) -> list[dict]:
         list: Concatenation of all `data` entries.
     """
     with scryfall_rate_limiter:
-        response = requests.get(url).json()
+        response = _session.get(url).json()
     assert response["object"]
 
     if "data" not in response:
@@ -121,11 +172,17 @@ def _get_database(database_name: str = "default_cards"):
     if len(bulk_data) != 1:
         raise ValueError(f"Unknown database {database_name}")
 
-    bulk_file = Path(get_file(bulk_data[0]["download_uri"].split("/")[-1], bulk_data[0]["download_uri"]))
+    file_name, url = bulk_data[0]["download_uri"].split("/")[-1], bulk_data[0]["download_uri"]
+    bulk_file = Path(get_file(file_name, url))
     pickle_file = bulk_file.with_suffix(".pickle")
     if not pickle_file.is_file():  # Convert json to pickle
-        with open(bulk_file, encoding="utf-8") as json_file:
-            data = json.load(json_file)
+        try:
+            with open(bulk_file, encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except FileNotFoundError:  # Deleted since the cache index was read, so treat it as a miss
+            _cached_files.discard(file_name)
+            with open(get_file(file_name, url), encoding="utf-8") as json_file:
+                data = json.load(json_file)
         with open(pickle_file, "wb") as pickle_file:
             pickle.dump(data, pickle_file, protocol=pickle.HIGHEST_PROTOCOL)
         return data
@@ -10,10 +10,12 @@ from urllib.parse import urlparse
 
 # Source https://github.com/advimman/lama
 def get_image(image):
+    # No copies here: the astype below always allocates a fresh array, and np.asarray
+    # wraps the buffer PIL exports through the array interface instead of duplicating it
     if isinstance(image, Image.Image):
-        img = np.array(image)
+        img = np.asarray(image)
     elif isinstance(image, np.ndarray):
-        img = image.copy()
+        img = image
     else:
         raise Exception("Input image should be either PIL Image or numpy array!")
 
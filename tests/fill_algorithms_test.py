@@ -0,0 +1,119 @@
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from contentAwareFill import fill_algorithms  # noqa: E402
+
+# Not present in the striped test image, so any unfilled hole pixel is easy to spot
+HOLE_COLOR = (255, 0, 255)
+
+
+class _Var:
+    """Stand-in for a Tk variable."""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def get(self) -> int:
+        return self.value
+
+
+class _Fill(fill_algorithms.FillAlgorithmsMixin):
+    """The fill algorithms without the dialog around them."""
+
+    def __init__(self, patch_size: int = 9, search_area: int = 30, feather: int = 0, radius: int = 3) -> None:
+        self.patch_size_var = _Var(patch_size)
+        self.search_area_var = _Var(search_area)
+        self.feather_edge_var = _Var(feather)
+        self.radius_var = _Var(radius)
+        self._preview_scale = 1.0
+        self._feather_cache = {}
+
+
+@pytest.fixture
+def striped_hole() -> tuple[np.ndarray, np.ndarray, tuple[int, int, int, int]]:
+    """Striped image with a hole, so the fill has texture to match and cannot take the flat-seed shortcut."""
+    x = np.arange(120)
+    img = np.zeros((90, 120, 3), dtype=np.uint8)
+    img[:, (x // 3) % 2 == 1] = (200, 180, 40)
+    coords = (50, 35, 66, 51)
+    img[coords[1] : coords[3], coords[0] : coords[2]] = HOLE_COLOR
+    mask = np.zeros(img.shape[:2], dtype=np.uint8)
+    mask[coords[1] : coords[3], coords[0] : coords[2]] = 255
+    return img, mask, coords
+
+
+def _check_fill(img: np.ndarray, result: np.ndarray, coords: tuple[int, int, int, int]) -> None:
+    x1, y1, x2, y2 = coords
+    hole = result[y1:y2, x1:x2]
+    assert not np.any(np.all(hole == HOLE_COLOR, axis=-1))
+
+    # Patch blending may soften one pixel past the hole; everything further away is untouched
+    outside = np.ones(img.shape[:2], dtype=bool)
+    outside[max(0, y1 - 2) : y2 + 2, max(0, x1 - 2) : x2 + 2] = False
+    np.testing.assert_array_equal(result[outside], img[outside])
+
+
+def test_patch_match_inpaint_template(striped_hole: tuple, monkeypatch: pytest.MonkeyPatch):
+    img, mask, coords = striped_hole
+    monkeypatch.setattr(fill_algorithms, "_fill_patches_jit", None)
+
+    result = _Fill()._patch_match_inpaint(img, mask, coords)
+
+    _check_fill(img, result, coords)
+
+
+@pytest.mark.parametrize(
+    "scale,preview,expected",
+    [
+        (1.0, True, (4, 5, 15, 40)),
+        (0.5, False, (4, 5, 15, 40)),
+        (0.5, True, (2, 2, 9, 20)),
+        (0.1, True, (1, 1, 3, 4)),
+    ],
+)
+def test_get_fill_params(scale: float, preview: bool, expected: tuple[int, int, int, int]):
+    fill = _Fill(patch_size=15, search_area=40, feather=4, radius=5)
+    fill._preview_scale = scale
+
+    assert fill.get_fill_params(preview) == expected
+
+
+@pytest.mark.parametrize("rect", [(16, 20, 48, 44), (0, 2, 30, 64)])
+@pytest.mark.parametrize("feather", [1, 3, 6])
+def test_get_feathered_mask_matches_full_blur(rect: tuple[int, int, int, int], feather: int):
+    x1, y1, x2, y2 = rect
+    mask = np.zeros((64, 80), dtype=np.uint8)
+    mask[y1:y2, x1:x2] = 255
+    expected = fill_algorithms.FillAlgorithmsMixin.blur_mask(mask, feather)
+
+    feathered = _Fill().get_feathered_mask(mask.shape, rect, feather)
+
+    np.testing.assert_array_equal(feathered, expected)
+
+
+def test_patch_match_inpaint_numba(striped_hole: tuple):
+    pytest.importorskip("numba")
+    img, mask, coords = striped_hole
+    assert fill_algorithms._fill_patches_jit is not None
+
+    result = _Fill()._patch_match_inpaint(img, mask, coords)
+
+    _check_fill(img, result, coords)
+
+
+@pytest.mark.parametrize("coords", [(0, 0, 14, 12), (104, 76, 120, 90)])
+def test_patch_match_inpaint_numba_at_image_edge(coords: tuple[int, int, int, int]):
+    # Offsets propagated from clipped patches at the edge must not send candidates outside the image
+    pytest.importorskip("numba")
+    x = np.arange(120)
+    img = np.zeros((90, 120, 3), dtype=np.uint8)
+    img[:, (x // 3) % 2 == 1] = (200, 180, 40)
+    img[coords[1] : coords[3], coords[0] : coords[2]] = HOLE_COLOR
+    mask = np.zeros(img.shape[:2], dtype=np.uint8)
+    mask[coords[1] : coords[3], coords[0] : coords[2]] = 255
+
+    result = _Fill()._patch_match_inpaint(img, mask, coords)
+
+    _check_fill(img, result, coords)
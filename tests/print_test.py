@@ -44,3 +44,101 @@ def test_print_cards_matplotlib_png(example_images: list[str], tmp_path: Path):
     print_cards_matplotlib(example_images, out_file)
 
     assert (tmp_path / "decklist_000.png").is_file()
+
+
+def _write_cards(directory: Path, count: int) -> list[str]:
+    """Write distinct card-sized PNGs, so the tests need no downloads."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    directory.mkdir()
+    gradient = np.linspace(0, 1, 1040 * 745, dtype=np.float32).reshape(1040, 745)
+    images = []
+    for i in range(count):
+        image = str(directory / f"card{i}.png")
+        plt.imsave(image, np.dstack([gradient, np.roll(gradient, i * 1000), np.full_like(gradient, i / count)]))
+        images.append(image)
+    return images
+
+
+@pytest.fixture
+def pdf_events(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Record the pages and image placements written by FPDF; PDF files differ in their creation date."""
+    import fpdf
+
+    events = []
+    add_page, image = fpdf.FPDF.add_page, fpdf.FPDF.image
+
+    def record_add_page(self, *args, **kwargs):
+        events.append("page")
+        return add_page(self, *args, **kwargs)
+
+    def record_image(self, name, *args, **kwargs):
+        events.append((Path(name).name, kwargs["x"], kwargs["y"], kwargs["w"], kwargs["h"]))
+        return image(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(fpdf.FPDF, "add_page", record_add_page)
+    monkeypatch.setattr(fpdf.FPDF, "image", record_image)
+    return events
+
+
+def test_print_cards_fpdf_layout(tmp_path: Path, pdf_events: list):
+    import numpy as np
+
+    from mtgproxies import print_cards_fpdf
+    from mtgproxies.print_cards import _occupied_space, image_size
+
+    papersize, cardsize, border_crop = np.array([210, 297]), np.array([2.5 * 25.4, 3.5 * 25.4]), 14
+    images = _write_cards(tmp_path / "cards", 11)
+    print_cards_fpdf(images, tmp_path / "layout.pdf", papersize=papersize, cardsize=cardsize, border_crop=border_crop)
+
+    # Place each card the way the layout was computed before it was vectorized
+    N = np.floor(papersize / cardsize).astype(int)
+    offset = (papersize - _occupied_space(cardsize, N, border_crop, closed=True)) / 2
+    expected = []
+    for i, image in enumerate(images):
+        slot = i % (N[0] * N[1])
+        if slot == 0:
+            expected.append("page")
+        x, y = slot % N[0], slot // N[0]
+        left, top = (border_crop if x > 0 else 0), (border_crop if y > 0 else 0)
+        lower = offset + _occupied_space(cardsize, np.array([x, y]), border_crop)
+        size = cardsize * (image_size - [left, top]) / image_size
+        name = Path(image).name if left == 0 and top == 0 else f"{Path(image).stem}_{left}_{top}.png"
+        expected.append((name, *lower, *size))
+
+    assert len(pdf_events) == len(expected)
+    for event, expected_event in zip(pdf_events, expected):
+        if event == "page":
+            assert expected_event == "page"
+        else:
+            assert event[0] == expected_event[0]
+            assert event[1:] == pytest.approx(expected_event[1:])
+
+
+def test_print_cards_fpdf_parallel_crops(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, pdf_events: list):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    from mtgproxies import print_cards as print_cards_module
+    from mtgproxies import print_cards_fpdf
+
+    # Two A4 sheets of distinct cards need 16 crops, above the parallel threshold
+    runs = {}
+    for mode, parallel_min in [("parallel", 1), ("sequential", 10_000)]:
+        monkeypatch.setattr(print_cards_module, "_PARALLEL_CROP_MIN", parallel_min)
+        images = _write_cards(tmp_path / mode, 18)
+        pdf_events.clear()
+        print_cards_fpdf(images, tmp_path / f"{mode}.pdf")
+
+        assert (tmp_path / f"{mode}.pdf").is_file()
+        crops = sorted((tmp_path / mode).glob("card*_*_*.png"))
+        runs[mode] = (list(pdf_events), [crop.name for crop in crops], [plt.imread(crop) for crop in crops])
+
+    parallel, sequential = runs["parallel"], runs["sequential"]
+    assert pdf_events.count("page") == 2
+    assert len(parallel[1]) == 16
+    assert parallel[0] == sequential[0]
+    assert parallel[1] == sequential[1]
+    for parallel_crop, sequential_crop in zip(parallel[2], sequential[2]):
+        np.testing.assert_array_equal(parallel_crop, sequential_crop)
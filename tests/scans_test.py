@@ -28,3 +28,57 @@ def test_fetch_scans_scryfall(example_decklist: Decklist, faces: str, expected_i
     images = fetch_scans_scryfall(example_decklist, faces=faces)
 
     assert len(images) == expected_images
+
+
+@pytest.fixture
+def offline_decklist() -> Decklist:
+    """Decklist with a repeated printing, several copies and a double-faced card, needing no database."""
+
+    def card(name: str, *faces: str) -> dict:
+        if len(faces) == 1:
+            return {"name": name, "image_uris": {"png": faces[0]}}
+        return {"name": name, "card_faces": [{"image_uris": {"png": face}} for face in faces]}
+
+    decklist = Decklist()
+    decklist.append_card(2, card("Forest", "forest.png"))
+    decklist.append_card(1, card("Delver of Secrets", "delver-front.png", "delver-back.png"))
+    decklist.append_comment("Sideboard")
+    decklist.append_card(1, card("Forest", "forest.png"))
+    return decklist
+
+
+@pytest.mark.parametrize(
+    "faces,expected_images",
+    [
+        ("all", ["forest.png", "forest.png", "delver-front.png", "delver-back.png", "forest.png"]),
+        ("front", ["forest.png", "forest.png", "delver-front.png", "forest.png"]),
+        ("back", ["delver-back.png"]),
+    ],
+)
+def test_fetch_scans_scryfall_progress(
+    monkeypatch: pytest.MonkeyPatch, offline_decklist: Decklist, faces: str, expected_images: list[str]
+):
+    import scryfall
+    from mtgproxies import fetch_scans_scryfall
+
+    requested = []
+
+    def get_image(image_uri: str, silent: bool = False) -> str:
+        requested.append(image_uri)
+        return "card_images/" + image_uri
+
+    monkeypatch.setattr(scryfall, "get_image", get_image)
+
+    progress = []
+    images = fetch_scans_scryfall(
+        offline_decklist, faces=faces, progress_cb=lambda fetched, total: progress.append((fetched, total))
+    )
+
+    # Each distinct scan is requested once, and filtered faces are never downloaded
+    expected_requests = set(expected_images)
+    assert sorted(requested) == sorted(expected_requests)
+    total = len(expected_requests)
+    assert progress == [(fetched, total) for fetched in range(1, total + 1)]
+    assert progress[-1][0] == progress[-1][1]
+    # One path per copy, in decklist order
+    assert images == ["card_images/" + image for image in expected_images]
@@ -1,3 +1,6 @@
+from collections.abc import Iterator
+from pathlib import Path
+
 import pytest
 
 
@@ -37,3 +40,98 @@ def test_canonic_card_name(name: str, expected_id: str):
     card = scryfall.get_card(name)
 
     assert card["id"] == expected_id
+
+
+@pytest.fixture
+def file_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, list[str]]:
+    """Point the scryfall file cache at an empty directory and record downloads instead of making them."""
+    from scryfall import scryfall
+
+    monkeypatch.setattr(scryfall, "cache", tmp_path)
+    monkeypatch.setattr(scryfall, "_cached_files", set())
+    downloads = []
+
+    def download(url: str, dst: Path, chunk_size: int = 1024 * 4, silent: bool = False) -> None:
+        downloads.append(url)
+        with open(dst, "wb") as f:
+            f.write(b"partial")
+            if url.endswith("/fail"):
+                raise ConnectionError("connection dropped")
+            f.write(b" and complete")
+
+    monkeypatch.setattr(scryfall, "download", download)
+    return tmp_path, downloads
+
+
+def test_get_file_cached(file_cache: tuple[Path, list[str]]):
+    from scryfall import scryfall
+
+    cache, downloads = file_cache
+
+    path = scryfall.get_file("card.png", "https://cards.scryfall.io/card.png")
+    assert path == str(cache / "card.png")
+    assert (cache / "card.png").read_bytes() == b"partial and complete"
+    assert "card.png" in scryfall._cached_files
+
+    # A hit is served from the cache
+    scryfall.get_file("card.png", "https://cards.scryfall.io/card.png")
+    assert len(downloads) == 1
+
+    # Hits trust the index; a file deleted behind the cache's back is downloaded again once it is re-read
+    (cache / "card.png").unlink()
+    scryfall.get_file("card.png", "https://cards.scryfall.io/card.png")
+    assert len(downloads) == 1
+    scryfall.refresh_cache_index()
+    assert "card.png" not in scryfall._cached_files
+    scryfall.get_file("card.png", "https://cards.scryfall.io/card.png")
+    assert len(downloads) == 2
+    assert (cache / "card.png").is_file()
+    assert scryfall._download_locks == {}
+
+
+def test_get_file_interrupted(file_cache: tuple[Path, list[str]]):
+    from scryfall import scryfall
+
+    cache, downloads = file_cache
+
+    with pytest.raises(ConnectionError):
+        scryfall.get_file("card.png", "https://cards.scryfall.io/fail")
+
+    # Neither a truncated file nor the temporary download is left behind
+    assert list(cache.iterdir()) == []
+    assert "card.png" not in scryfall._cached_files
+    assert scryfall._download_locks == {}
+
+
+@pytest.fixture
+def offline_cards(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[dict]]:
+    """Serve a small card list instead of the Scryfall bulk database, with the lookup indexes rebuilt from it."""
+    from scryfall import scryfall
+
+    cards = [
+        {"name": "Forest", "layout": "normal", "oracle_id": "forest"},
+        {"name": "Forest", "layout": "normal", "oracle_id": "forest"},
+        {
+            "name": "Murderous Rider // Swift End",
+            "layout": "adventure",
+            "card_faces": [{"oracle_id": "rider"}, {}],
+        },
+        {"name": "Forest // Forest", "layout": "art_series", "oracle_id": "forest-art"},
+    ]
+    monkeypatch.setattr(scryfall, "get_cards", lambda database="default_cards", **kwargs: cards)
+    scryfall.cards_by_oracle_id.cache_clear()
+    scryfall.oracle_ids_by_name.cache_clear()
+    yield cards
+    scryfall.cards_by_oracle_id.cache_clear()
+    scryfall.oracle_ids_by_name.cache_clear()
+
+
+def test_oracle_ids_by_name(offline_cards: list[dict]):
+    from scryfall import scryfall
+
+    assert {k: len(v) for k, v in scryfall.cards_by_oracle_id().items()} == {"forest": 2, "rider": 1, "forest-art": 1}
+    assert scryfall.oracle_ids_by_name() == {
+        "forest": ["forest"],
+        "murderous rider // swift end": ["rider"],
+        "murderous rider": ["rider"],
+    }